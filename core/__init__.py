@@ -1,17 +1,36 @@
 """Poker engine primitives reused by tournament and practice servers."""
 
-from .cards import Card, RANKS, SUITS, build_deck, deal
-from .evaluator import evaluate_best, parse_cards
+from .cards import BASE_DECK, Card, Deck, RANKS, SUITS, build_deck, card_int, card_label, deal, shuffle_into
+from .evaluator import (
+    decode_strength,
+    evaluate_board_batch,
+    evaluate_best,
+    evaluate_best_batch,
+    evaluate_cached,
+    hand_category,
+    parse_cards,
+)
 from .game import GameEngine, HandContext
 from .models import ActionType, Phase, PlayerSeat, TableConfig
+from .simulate import simulate_many
 
 __all__ = [
+    "BASE_DECK",
     "Card",
+    "Deck",
     "RANKS",
     "SUITS",
     "build_deck",
+    "card_int",
+    "card_label",
     "deal",
+    "decode_strength",
+    "shuffle_into",
+    "evaluate_board_batch",
     "evaluate_best",
+    "evaluate_best_batch",
+    "evaluate_cached",
+    "hand_category",
     "parse_cards",
     "GameEngine",
     "HandContext",
@@ -19,4 +38,5 @@ __all__ = [
     "Phase",
     "PlayerSeat",
     "TableConfig",
+    "simulate_many",
 ]
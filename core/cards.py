@@ -1,48 +1,144 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
-from typing import List, Optional
+from array import array
+from typing import Dict, List, MutableSequence, NewType, Optional, Sequence, Tuple
 
 RANKS = "AKQJT98765432"
 SUITS = "hdcs"
 
-@dataclass(frozen=True)
-class Card:
-    rank: str
-    suit: str
+# Cards are packed 32-bit ints in the Cactus-Kev layout:
+#
+#   xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+#
+#   b = one bit per rank (bit 16 = deuce ... bit 28 = ace)
+#   cdhs = suit flag, r = rank index (deuce = 0 ... ace = 12), p = rank prime
+#
+# Flush detection is an AND across the suit nibbles and the rank mask is an OR,
+# so the evaluator never touches strings.
+Card = NewType("Card", int)
 
-    def __post_init__(self) -> None:
-        if self.rank not in RANKS:
-            raise ValueError(f"Invalid rank: {self.rank}")
-        if self.suit not in SUITS:
-            raise ValueError(f"Invalid suit: {self.suit}")
+RANK_CHARS = "23456789TJQKA"
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+SUIT_BITS = {"h": 0x1000, "d": 0x2000, "c": 0x4000, "s": 0x8000}
 
-    @property
-    def label(self) -> str:
-        return f"{self.rank}{self.suit}"
 
+def _pack(rank_idx: int, suit: str) -> Card:
+    return Card((1 << (16 + rank_idx)) | SUIT_BITS[suit] | (rank_idx << 8) | RANK_PRIMES[rank_idx])
 
-def build_deck(seed: Optional[int] = None) -> List[Card]:
-    rng = random.Random(seed)
-    deck = [Card(rank, suit) for rank in RANKS[::-1] for suit in SUITS]
-    rng.shuffle(deck)
-    return deck
 
+# Indexed by rank_idx * 4 + suit_idx (suit order follows SUITS).
+CARD_INTS = tuple(_pack(rank_idx, suit) for rank_idx in range(len(RANK_CHARS)) for suit in SUITS)
+CARD_LABELS: Dict[int, str] = {
+    CARD_INTS[rank_idx * 4 + suit_idx]: f"{rank}{suit}"
+    for rank_idx, rank in enumerate(RANK_CHARS)
+    for suit_idx, suit in enumerate(SUITS)
+}
+LABEL_CARDS: Dict[str, Card] = {label: card for card, label in CARD_LABELS.items()}
+# Packed card -> dense id 0..51 (its position in CARD_INTS), for bitmask keys.
+CARD_IDS: Dict[int, int] = {card: idx for idx, card in enumerate(CARD_INTS)}
 
-def deal(deck: List[Card], count: int) -> List[Card]:
-    if len(deck) < count:
+# Unshuffled deck that every shuffle starts from.
+BASE_DECK: Tuple[Card, ...] = CARD_INTS
+# The same cards as a uint32 array; slicing it copies 208 contiguous bytes per hand.
+_BASE_ARRAY = array("I", BASE_DECK)
+
+
+def _ord_table(chars: str) -> bytes:
+    # ord(char) -> 1-based position in chars; 0 marks a character that is not in it.
+    table = bytearray(128)
+    for idx, char in enumerate(chars, start=1):
+        table[ord(char)] = idx
+    return bytes(table)
+
+
+_RANK_SLOT = _ord_table(RANK_CHARS)
+_SUIT_SLOT = _ord_table(SUITS)
+
+
+def card_int(rank: str, suit: str) -> Card:
+    rank_slot = _RANK_SLOT[ord(rank)] if len(rank) == 1 and rank < "\x80" else 0
+    if not rank_slot:
+        raise ValueError(f"Invalid rank: {rank}")
+    suit_slot = _SUIT_SLOT[ord(suit)] if len(suit) == 1 and suit < "\x80" else 0
+    if not suit_slot:
+        raise ValueError(f"Invalid suit: {suit}")
+    return CARD_INTS[(rank_slot - 1) * 4 + suit_slot - 1]
+
+
+def card_rank(card: int) -> int:
+    """Rank index of a packed card (deuce = 0 ... ace = 12)."""
+    return (card >> 8) & 0xF
+
+
+def card_suit(card: int) -> int:
+    """Suit flag of a packed card (one of the SUIT_BITS values shifted down)."""
+    return (card >> 12) & 0xF
+
+
+def card_label(card: int) -> str:
+    return CARD_LABELS[card]
+
+
+class Deck:
+    """Shuffled cards in a uint32 array plus a read cursor; dealing advances the cursor."""
+
+    __slots__ = ("cards", "pos")
+
+    def __init__(self, cards: Sequence[Card]) -> None:
+        self.cards = cards if isinstance(cards, array) else array("I", cards)
+        self.pos = 0
+
+    def __len__(self) -> int:
+        return len(self.cards) - self.pos
+
+    def reset(self) -> None:
+        self.pos = 0
+
+
+def shuffle_into(buf: MutableSequence[int], rng: random.Random) -> None:
+    """Fill a caller-owned 52-slot buffer with a fresh shuffle of BASE_DECK.
+
+    Uses ``rng.shuffle`` so a seeded buffer matches ``build_deck(seed)``.
+    """
+    buf[:] = BASE_DECK
+    rng.shuffle(buf)
+
+
+# Unseeded decks draw from one generator seeded from os.urandom at import; seeded decks
+# reseed a separate generator so they never disturb the unseeded stream.
+_RNG = random.Random()
+_SEEDED_RNG = random.Random()
+
+
+def build_deck(seed: Optional[int] = None) -> Deck:
+    if seed is None:
+        rng = _RNG
+    else:
+        rng = _SEEDED_RNG
+        rng.seed(seed)
+    cards = _BASE_ARRAY[:]
+    rng.shuffle(cards)
+    return Deck(cards)
+
+
+def deal(deck: Deck, count: int) -> List[Card]:
+    pos = deck.pos
+    end = pos + count
+    if end > len(deck.cards):
         raise ValueError("Not enough cards left in deck")
-    cards = deck[:count]
-    del deck[:count]
-    return cards
+    deck.pos = end
+    return list(deck.cards[pos:end])
 
 
-def cards_to_labels(cards: List[Card]) -> List[str]:
-    return [card.label for card in cards]
+def cards_to_labels(cards: Sequence[int]) -> List[str]:
+    return [CARD_LABELS[card] for card in cards]
 
 
 def parse_label(label: str) -> Card:
+    card = LABEL_CARDS.get(label)
+    if card is not None:
+        return card
     if len(label) != 2:
         raise ValueError(f"Invalid card label: {label}")
-    return Card(label[0], label[1])
+    return card_int(label[0], label[1])
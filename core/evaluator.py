@@ -1,82 +1,305 @@
 from __future__ import annotations
 
 import itertools
-from typing import Iterable, List, Optional, Sequence, Tuple
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence
 
-from .cards import Card, parse_label
+from .cards import CARD_IDS, CARD_INTS, RANK_PRIMES, Card, parse_label
 
 RANK_ORDER = "23456789TJQKA"
-RANK_VALUE = {rank: idx for idx, rank in enumerate(RANK_ORDER, start=2)}
 
 
-def evaluate_best(cards: Sequence[Card]) -> Tuple[int, List[int]]:
-    """Return a strength tuple for up to 7 cards (Texas Hold'em). Higher is better."""
-    best: Optional[Tuple[int, List[int]]] = None
+def _build_rank_values() -> bytes:
+    # ord(rank char) -> rank value (2..14); 0 for anything that is not a rank.
+    table = bytearray(128)
+    for value, rank in enumerate(RANK_ORDER, start=2):
+        table[ord(rank)] = value
+    return bytes(table)
+
+
+RANK_VALUE_BYTES = _build_rank_values()
+# Deprecated: index RANK_VALUE_BYTES with ord(rank) instead.
+RANK_VALUE = {rank: RANK_VALUE_BYTES[ord(rank)] for rank in RANK_ORDER}
+
+# Strengths pack the category into bits 20+ and up to five 4-bit rank values
+# (2..14, most significant first) below it, so plain int comparison orders hands.
+CATEGORY_SHIFT = 20
+
+# Straight masks from broadway down to the wheel (A-2-3-4-5).
+_STRAIGHTS = tuple(0x1F00 >> shift for shift in range(9)) + (0x100F,)
+
+
+def _build_straight_high() -> array:
+    # Any rank mask -> high card value (5..14) of the best straight it contains, or 0.
+    table = array("B", bytes(1 << 13))
+    for high, straight in zip(range(14, 4, -1), _STRAIGHTS):
+        for mask in range(straight, 1 << 13):
+            if mask & straight == straight and not table[mask]:
+                table[mask] = high
+    return table
+
+
+STRAIGHT_HIGH = _build_straight_high()
+
+
+def _prime_product(ranks: Sequence[int]) -> int:
+    product = 1
+    for rank in ranks:
+        product *= RANK_PRIMES[rank]
+    return product
+
+
+def _mask_ranks(mask: int) -> List[int]:
+    return [rank for rank in range(12, -1, -1) if mask & (1 << rank)]
+
+
+def _pack_strength(category: int, ranks: Sequence[int]) -> int:
+    strength = category
+    for rank in ranks:
+        strength = (strength << 4) | (rank + 2)
+    return strength << (4 * (5 - len(ranks)))
+
+
+def _build_tables() -> tuple[array, Dict[int, int]]:
+    # Flush strengths are indexed directly by the 13-bit rank mask; unused slots stay 0.
+    flush = array("I", bytes(4 << 13))
+    unsuited: Dict[int, int] = {}
+    ranks_desc = list(range(12, -1, -1))
+
+    for mask in range(1 << 13):
+        if bin(mask).count("1") != 5:
+            continue
+        high = STRAIGHT_HIGH[mask]
+        if high:
+            flush[mask] = _pack_strength(8, [high - 2])
+            unsuited[_prime_product(_mask_ranks(mask))] = _pack_strength(4, [high - 2])
+        else:
+            flush[mask] = _pack_strength(5, _mask_ranks(mask))
+            unsuited[_prime_product(_mask_ranks(mask))] = _pack_strength(0, _mask_ranks(mask))
+    for quad in ranks_desc:
+        for kicker in ranks_desc:
+            if kicker != quad:
+                unsuited[RANK_PRIMES[quad] ** 4 * RANK_PRIMES[kicker]] = _pack_strength(7, [quad, kicker])
+    for trips in ranks_desc:
+        for pair in ranks_desc:
+            if pair != trips:
+                unsuited[RANK_PRIMES[trips] ** 3 * RANK_PRIMES[pair] ** 2] = _pack_strength(6, [trips, pair])
+    for trips in ranks_desc:
+        others = [r for r in ranks_desc if r != trips]
+        for kickers in itertools.combinations(others, 2):
+            unsuited[RANK_PRIMES[trips] ** 3 * _prime_product(kickers)] = _pack_strength(3, [trips, *kickers])
+    for high, low in itertools.combinations(ranks_desc, 2):
+        for kicker in ranks_desc:
+            if kicker not in (high, low):
+                product = RANK_PRIMES[high] ** 2 * RANK_PRIMES[low] ** 2 * RANK_PRIMES[kicker]
+                unsuited[product] = _pack_strength(2, [high, low, kicker])
+    for pair in ranks_desc:
+        others = [r for r in ranks_desc if r != pair]
+        for kickers in itertools.combinations(others, 3):
+            unsuited[RANK_PRIMES[pair] ** 2 * _prime_product(kickers)] = _pack_strength(1, [pair, *kickers])
+
+    # 1287 flush masks plus the 6175 non-flush classes of Cactus-Kev.
+    assert len(unsuited) == 6175
+    return flush, unsuited
+
+
+# Indexed by the OR of the five rank bits (flushes) or keyed by the product of rank primes.
+FLUSH_LOOKUP, UNSUITED_LOOKUP = _build_tables()
+
+
+# The 21 five-card subsets of seven cards, flattened to 105 card indexes.
+COMBOS_7_5 = array("B", itertools.chain.from_iterable(itertools.combinations(range(7), 5)))
+
+
+def evaluate_best(cards: Sequence[Card]) -> int:
+    """Return the strength of the best 5-card hand within up to 7 cards. Higher is better."""
+    count = len(cards)
+    if count == 7:
+        return _evaluate_seven(cards)
+    if count == 5:
+        return eval5(*cards)
+    if count == 6:
+        return _evaluate_six(*cards)
+    best = 0
     for combo in itertools.combinations(cards, 5):
-        rank = _evaluate_five(combo)
-        if best is None or rank > best:
-            best = rank
-    assert best is not None
+        strength = eval5(*combo)
+        if strength > best:
+            best = strength
     return best
 
 
-def _evaluate_five(cards: Iterable[Card]) -> Tuple[int, List[int]]:
-    ranks = sorted((RANK_VALUE[card.rank] for card in cards), reverse=True)
-    suits = [card.suit for card in cards]
+def _evaluate_seven(cards: Sequence[Card]) -> int:
+    flush = FLUSH_LOOKUP
+    unsuited = UNSUITED_LOOKUP
+    combos = COMBOS_7_5
+    best = 0
+    for i in range(0, 105, 5):
+        c1 = cards[combos[i]]
+        c2 = cards[combos[i + 1]]
+        c3 = cards[combos[i + 2]]
+        c4 = cards[combos[i + 3]]
+        c5 = cards[combos[i + 4]]
+        if c1 & c2 & c3 & c4 & c5 & 0xF000:
+            strength = flush[(c1 | c2 | c3 | c4 | c5) >> 16]
+        else:
+            strength = unsuited[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+        if strength > best:
+            best = strength
+    return best
 
-    is_flush = len(set(suits)) == 1
-    straight_high = _straight_high(cards)
 
-    counts = {}
+def evaluate_cached(cards: Sequence[Card]) -> int:
+    """Like evaluate_best, but memoized on the set of cards (order does not matter)."""
+    mask = 0
     for card in cards:
-        counts.setdefault(card.rank, 0)
-        counts[card.rank] += 1
-
-    ordered_counts = sorted(counts.items(), key=lambda x: (x[1], RANK_VALUE[x[0]]), reverse=True)
-    count_values = sorted(counts.values(), reverse=True)
-
-    if straight_high and is_flush:
-        return (8, [straight_high])
-    if count_values[0] == 4:
-        four_rank = RANK_VALUE[ordered_counts[0][0]]
-        kicker = max(RANK_VALUE[r] for r, c in ordered_counts if r != ordered_counts[0][0])
-        return (7, [four_rank, kicker])
-    if count_values[0] == 3 and count_values[1] == 2:
-        trips = RANK_VALUE[ordered_counts[0][0]]
-        pair = RANK_VALUE[ordered_counts[1][0]]
-        return (6, [trips, pair])
-    if is_flush:
-        return (5, ranks)
-    if straight_high:
-        return (4, [straight_high])
-    if count_values[0] == 3:
-        trips_rank = RANK_VALUE[ordered_counts[0][0]]
-        kickers = [RANK_VALUE[r] for r, c in ordered_counts[1:]]
-        return (3, [trips_rank] + kickers)
-    if count_values[0] == 2 and count_values[1] == 2:
-        pair_high = RANK_VALUE[ordered_counts[0][0]]
-        pair_low = RANK_VALUE[ordered_counts[1][0]]
-        kicker = max(RANK_VALUE[r] for r, c in ordered_counts if c == 1)
-        return (2, [pair_high, pair_low, kicker])
-    if count_values[0] == 2:
-        pair_rank = RANK_VALUE[ordered_counts[0][0]]
-        kickers = [RANK_VALUE[r] for r, c in ordered_counts[1:]]
-        return (1, [pair_rank] + kickers)
-    return (0, ranks)
-
-
-def _straight_high(cards: Iterable[Card]) -> Optional[int]:
-    ranks = {RANK_VALUE[card.rank] for card in cards}
-    if 14 in ranks:  # Ace low
-        ranks.add(1)
-    ordered = sorted(ranks)
-    for idx in range(len(ordered) - 4):
-        window = ordered[idx : idx + 5]
-        if window == list(range(window[0], window[0] + 5)):
-            return window[-1]
-    if set([14, 5, 4, 3, 2]).issubset(ranks):
-        return 5
-    return None
+        mask |= 1 << CARD_IDS[card]
+    return _evaluate_mask(mask)
+
+
+@lru_cache(maxsize=1 << 20)
+def _evaluate_mask(mask: int) -> int:
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(CARD_INTS[low.bit_length() - 1])
+        mask ^= low
+    return evaluate_best(cards)
+
+
+def _board_parts(board: Sequence[Card], size: int) -> List[tuple[int, int, int]]:
+    # (suit AND, rank OR, prime product) of every `size`-card subset of the board.
+    parts = []
+    for combo in itertools.combinations(board, size):
+        suits = 0xF000
+        ranks = 0
+        product = 1
+        for card in combo:
+            suits &= card
+            ranks |= card
+            product *= card & 0xFF
+        parts.append((suits, ranks, product))
+    return parts
+
+
+def evaluate_board_batch(board: Sequence[Card], holes: Iterable[Sequence[Card]]) -> List[int]:
+    """Evaluate many two-card holdings against one shared five-card board.
+
+    The board's four- and three-card partial results are computed once, so each
+    holding only has to fold its own cards into 20 precomputed combos.
+    """
+    if len(board) != 5:
+        return [evaluate_best(list(hole) + list(board)) for hole in holes]
+    flush = FLUSH_LOOKUP
+    unsuited = UNSUITED_LOOKUP
+    board_strength = eval5(*board)
+    fours = _board_parts(board, 4)
+    threes = _board_parts(board, 3)
+    results: List[int] = []
+    for h1, h2 in holes:
+        best = board_strength
+        for hole in (h1, h2):
+            prime = hole & 0xFF
+            for suits, ranks, product in fours:
+                if suits & hole:
+                    strength = flush[(ranks | hole) >> 16]
+                else:
+                    strength = unsuited[product * prime]
+                if strength > best:
+                    best = strength
+        both_suit = h1 & h2
+        both_rank = h1 | h2
+        both_prime = (h1 & 0xFF) * (h2 & 0xFF)
+        for suits, ranks, product in threes:
+            if suits & both_suit:
+                strength = flush[(ranks | both_rank) >> 16]
+            else:
+                strength = unsuited[product * both_prime]
+            if strength > best:
+                best = strength
+        results.append(best)
+    return results
+
+
+def _evaluate_six(c1: int, c2: int, c3: int, c4: int, c5: int, c6: int) -> int:
+    # Each five-card subset drops exactly one of the six cards.
+    return max(
+        eval5(c2, c3, c4, c5, c6),
+        eval5(c1, c3, c4, c5, c6),
+        eval5(c1, c2, c4, c5, c6),
+        eval5(c1, c2, c3, c5, c6),
+        eval5(c1, c2, c3, c4, c6),
+        eval5(c1, c2, c3, c4, c5),
+    )
+
+
+def evaluate_best_batch(hands: Iterable[Sequence[Card]]) -> List[int]:
+    """Evaluate many hands in one call; seven-card hands share one inlined loop."""
+    flush = FLUSH_LOOKUP
+    unsuited = UNSUITED_LOOKUP
+    combos = COMBOS_7_5
+    results: List[int] = []
+    append = results.append
+    for cards in hands:
+        if len(cards) != 7:
+            append(evaluate_best(cards))
+            continue
+        best = 0
+        for i in range(0, 105, 5):
+            c1 = cards[combos[i]]
+            c2 = cards[combos[i + 1]]
+            c3 = cards[combos[i + 2]]
+            c4 = cards[combos[i + 3]]
+            c5 = cards[combos[i + 4]]
+            if c1 & c2 & c3 & c4 & c5 & 0xF000:
+                strength = flush[(c1 | c2 | c3 | c4 | c5) >> 16]
+            else:
+                strength = unsuited[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+            if strength > best:
+                best = strength
+        append(best)
+    return results
+
+
+def eval5(
+    c1: int,
+    c2: int,
+    c3: int,
+    c4: int,
+    c5: int,
+    _flush: array = FLUSH_LOOKUP,
+    _unsuited: Dict[int, int] = UNSUITED_LOOKUP,
+) -> int:
+    """Score exactly five packed cards without building any container.
+
+    The trailing defaults bind the tables as locals; callers never pass them.
+    """
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return _flush[(c1 | c2 | c3 | c4 | c5) >> 16]
+    return _unsuited[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+
+def straight_high(cards: Sequence[Card]) -> int:
+    """High card value (5..14) of the best straight among any number of cards, or 0."""
+    mask = 0
+    for card in cards:
+        mask |= card
+    return STRAIGHT_HIGH[mask >> 16]
+
+
+def hand_category(strength: int) -> int:
+    """Map a strength to its category: 8 = straight flush ... 0 = high card."""
+    return strength >> CATEGORY_SHIFT
+
+
+def decode_strength(strength: int) -> tuple[int, List[int]]:
+    """Split a strength into its category and rank values (2..14), most significant first."""
+    kickers = []
+    for shift in range(16, -1, -4):
+        value = (strength >> shift) & 0xF
+        if value:
+            kickers.append(value)
+    return strength >> CATEGORY_SHIFT, kickers
 
 
 def parse_cards(labels: Sequence[str]) -> List[Card]:
@@ -2,55 +2,118 @@ from __future__ import annotations
 
 import itertools
 import time
-from collections import deque
 from dataclasses import dataclass, field
-from typing import Deque, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, time as dt_time
+from typing import Dict, List, Optional, Tuple
 
-from .cards import Card, build_deck, deal
-from .evaluator import evaluate_best, parse_cards
+from .cards import Card, Deck, build_deck, cards_to_labels, deal
+from .evaluator import CATEGORY_SHIFT, evaluate_board_batch
 from .models import ActionType, Phase, PlayerSeat, TableConfig
 
 # GameEngine keeps all table state in memory. No networking lives here—only
 # poker rules, chip accounting, and betting order.
 
 
-@dataclass
+LegalActions = Tuple[List[ActionType], Optional[int], Optional[int], Optional[int]]
+# Same shape as LegalActions, with the actions folded into an int of the *_BIT flags below.
+LegalMask = Tuple[int, Optional[int], Optional[int], Optional[int]]
+
+FOLD_BIT = 1
+CHECK_BIT = 2
+CALL_BIT = 4
+RAISE_TO_BIT = 8
+# In the order legal_actions lists them.
+_ACTION_BITS = (
+    (FOLD_BIT, ActionType.FOLD),
+    (CHECK_BIT, ActionType.CHECK),
+    (CALL_BIT, ActionType.CALL),
+    (RAISE_TO_BIT, ActionType.RAISE_TO),
+)
+
+
+@dataclass(slots=True)
 class HandContext:
     # All mutable info about the current hand (deck, pot, actor queue, etc.).
     hand_id: str
     seed: int
     button: int
-    deck: List[Card]
+    deck: Deck
+    hand_number: int = 0
     community: List[Card] = field(default_factory=list)
     phase: Phase = Phase.PRE_FLOP
     pot: int = 0
     current_bet: int = 0
     min_raise_increment: int = 0
     last_raise_seat: Optional[int] = None
-    pending_callers: set[int] = field(default_factory=set)
-    actor_queue: Deque[int] = field(default_factory=deque)
+    # Bit i set: seat i was dealt into this hand / has folded / is all-in / still owes an action.
+    in_hand_mask: int = 0
+    folded_mask: int = 0
+    all_in_mask: int = 0
+    pending_callers_mask: int = 0
+    # Betting order for the current round; actor_pos points at the seat to act next.
+    rotation: List[int] = field(default_factory=list)
+    actor_pos: int = 0
     pre_events: List[Dict[str, object]] = field(default_factory=list)
-
-
-def describe_rank(score: Tuple[int, List[int]]) -> str:
-    category, kickers = score
-    if category == 8:
-        return "straight_flush"
-    if category == 7:
-        return "four_of_a_kind"
-    if category == 6:
-        return "full_house"
-    if category == 5:
-        return "flush"
-    if category == 4:
-        return "straight"
-    if category == 3:
-        return "three_of_a_kind"
-    if category == 2:
-        return "two_pair"
-    if category == 1:
-        return "pair"
-    return "high_card"
+    # Bumped on every applied action; payload pieces cached against it are rebuilt when it moves.
+    state_version: int = 0
+    community_labels: List[str] = field(default_factory=list)
+    players_view: List[Dict[str, object]] = field(default_factory=list)
+    players_view_version: int = -1
+    # seat -> (state_version, legal_actions result, legal_action_mask result) so repeated payloads skip the recompute.
+    legal_cache: Dict[int, Tuple[int, LegalActions, LegalMask]] = field(default_factory=dict)
+
+
+# (expires_at, "YYYYMMDD"): the local date only changes at midnight, so strftime runs once a day.
+_date_cache: Tuple[float, str] = (0.0, "")
+
+
+def _hand_date() -> str:
+    global _date_cache
+    now = time.time()
+    expires_at, date = _date_cache
+    if now >= expires_at:
+        local = datetime.fromtimestamp(now)
+        date = local.strftime("%Y%m%d")
+        # Days around a DST switch are 23 or 25 hours long, so ask for the next midnight directly.
+        next_midnight = datetime.combine(local.date() + timedelta(days=1), dt_time())
+        _date_cache = (next_midnight.timestamp(), date)
+    return date
+
+
+def _mask_seats(mask: int) -> List[int]:
+    # Seat indexes of the set bits, lowest first.
+    seats = []
+    while mask:
+        low = mask & -mask
+        seats.append(low.bit_length() - 1)
+        mask ^= low
+    return seats
+
+
+# Street transitions: current phase -> (next phase, cards to deal, event name).
+_PHASE_TABLE: Dict[Phase, Tuple[Phase, int, str]] = {
+    Phase.PRE_FLOP: (Phase.FLOP, 3, "FLOP"),
+    Phase.FLOP: (Phase.TURN, 1, "TURN"),
+    Phase.TURN: (Phase.RIVER, 1, "RIVER"),
+}
+
+
+# Indexed by hand category (0 = high card ... 8 = straight flush).
+RANK_NAMES = (
+    "high_card",
+    "pair",
+    "two_pair",
+    "three_of_a_kind",
+    "straight",
+    "flush",
+    "full_house",
+    "four_of_a_kind",
+    "straight_flush",
+)
+
+
+def describe_rank(score: int) -> str:
+    return RANK_NAMES[score >> CATEGORY_SHIFT]
 
 
 class GameEngine:
@@ -62,6 +125,20 @@ class GameEngine:
         self.button: Optional[int] = None
         self.hand_counter = 0
         self.hand: Optional[HandContext] = None
+        # Normalized team name -> seat, so reconnects do not scan the table.
+        self._team_index: Dict[str, PlayerSeat] = {}
+        # Every seat index in table order starting from each possible start seat.
+        self._rotations: List[Tuple[int, ...]] = [
+            tuple((start + offset) % config.seats for offset in range(config.seats))
+            for start in range(config.seats)
+        ]
+        # Table settings are fixed for the match; only the button moves between hands.
+        self._table_dict: Dict[str, object] = {
+            "sb": config.sb,
+            "bb": config.bb,
+            "seats": config.seats,
+            "button": None,
+        }
 
     # Seat management -------------------------------------------------
 
@@ -82,6 +159,7 @@ class GameEngine:
             if seat is None:
                 seat = PlayerSeat(seat=idx, team=team_display, team_key=team_key, stack=self.config.starting_stack)
                 self.seats[idx] = seat
+                self._team_index[team_key] = seat
                 return seat
 
         raise RuntimeError("Table is full")
@@ -90,26 +168,36 @@ class GameEngine:
         return team.strip().casefold()
 
     def _find_seat_by_key(self, team_key: str) -> Optional[PlayerSeat]:
-        for seat in self.seats:
-            if seat and seat.team_key == team_key:
-                return seat
-        return None
+        seat = self._team_index.get(team_key)
+        if seat is not None and self.seats[seat.seat] is not seat:
+            # The seat was cleared from the table; forget the stale entry.
+            del self._team_index[team_key]
+            return None
+        return seat
 
     def seating_order(self) -> List[int]:
-        return [seat.seat for seat in self.seats if seat and seat.stack > 0]
+        return _mask_seats(self._stacked_mask())
+
+    def _stacked_mask(self) -> int:
+        # Seats that still have chips, i.e. everyone who can be dealt into the next hand.
+        mask = 0
+        for seat in self.seats:
+            if seat and seat.stack > 0:
+                mask |= 1 << seat.seat
+        return mask
 
     # Hand lifecycle --------------------------------------------------
     def can_start_hand(self) -> bool:
-        active = [seat for seat in self.seats if seat and seat.stack > 0]
-        return len(active) >= 2
+        return self._stacked_mask().bit_count() >= 2
 
     def start_hand(self, seed: Optional[int] = None) -> HandContext:
-        if not self.can_start_hand():
+        stacked = self._stacked_mask()
+        if stacked.bit_count() < 2:
             raise RuntimeError("Not enough active players to start a hand")
 
-        active = [seat for seat in self.seats if seat and seat.stack > 0]
-        for seat in active:
-            seat.reset_for_hand()
+        seats = self.seats
+        for seat_idx in _mask_seats(stacked):
+            seats[seat_idx].reset_for_hand()
 
         if seed is None:
             seed = int(time.time() * 1000) & 0xFFFFFFFF
@@ -117,11 +205,12 @@ class GameEngine:
 
         # Move button
         if self.button is None:
-            self.button = active[0].seat
+            self.button = (stacked & -stacked).bit_length() - 1
         else:
-            self.button = self._next_active_seat(self.button)
+            self.button = self._next_active_seat(self.button, stacked)
 
-        hand_id = f"H-{time.strftime('%Y%m%d')}-{self.hand_counter:05d}"
+        hand_number = self.hand_counter
+        hand_id = f"H-{_hand_date()}-{hand_number:05d}"
         self.hand_counter += 1
 
         ctx = HandContext(
@@ -129,15 +218,21 @@ class GameEngine:
             seed=seed,
             button=self.button,
             deck=deck,
+            hand_number=hand_number,
             community=[],
             phase=Phase.PRE_FLOP,
             pot=0,
             current_bet=0,
             min_raise_increment=self.config.bb,
             last_raise_seat=None,
-            pending_callers=set(),
-            actor_queue=deque(),
+            in_hand_mask=stacked,
+            folded_mask=0,
+            all_in_mask=0,
+            pending_callers_mask=0,
+            rotation=[],
+            actor_pos=0,
         )
+        self._table_dict["button"] = ctx.button
 
         self._deal_hole_cards(ctx)
         self._post_blinds(ctx)
@@ -146,35 +241,46 @@ class GameEngine:
         return ctx
 
     def _deal_hole_cards(self, ctx: HandContext) -> None:
-        ordered = self._active_seats_starting_from(ctx.button)
+        ordered = self._rotation_from(ctx, ctx.button + 1)
         for _ in range(2):
             for seat_idx in ordered:
                 seat = self.seats[seat_idx]
                 if seat is None:
                     continue
                 card = deal(ctx.deck, 1)[0]
-                seat.hole_cards.append(card.label)
+                seat.hole_cards.append(card)
 
     def _post_blinds(self, ctx: HandContext) -> None:
-        active = [seat for seat in self.seats if seat and seat.stack > 0]
-        if len(active) < 2:
+        dealt = ctx.in_hand_mask
+        seated = dealt.bit_count()
+        if seated < 2:
             raise RuntimeError("Not enough active seats for blinds")
 
-        heads_up = len(active) == 2
+        heads_up = seated == 2
         if heads_up:
             sb_seat = ctx.button
-            bb_seat = self._next_active_seat(ctx.button)
+            bb_seat = self._next_active_seat(ctx.button, dealt)
         else:
-            sb_seat = self._next_active_seat(ctx.button)
-            bb_seat = self._next_active_seat(sb_seat)
+            sb_seat = self._next_active_seat(ctx.button, dealt)
+            bb_seat = self._next_active_seat(sb_seat, dealt)
         sb_player = self.seats[sb_seat]
         bb_player = self.seats[bb_seat]
         assert sb_player and bb_player
 
-        self._commit_chips(sb_player, min(sb_player.stack, self.config.sb), ctx)
-        self._commit_chips(bb_player, min(bb_player.stack, self.config.bb), ctx)
-
-        ctx.current_bet = max(player.committed for player in (sb_player, bb_player))
+        for player, blind in ((sb_player, self.config.sb), (bb_player, self.config.bb)):
+            # Short stacks post whatever they have left.
+            posted = min(player.stack, blind)
+            player.stack -= posted
+            player.committed += posted
+            player.total_in_pot += posted
+            ctx.pot += posted
+            if player.stack == 0:
+                ctx.all_in_mask |= 1 << player.seat
+
+        ctx.current_bet = bb_player.committed
+        if sb_player.committed > ctx.current_bet:
+            # Only when the big blind's stack was short of the small blind.
+            ctx.current_bet = sb_player.committed
         ctx.min_raise_increment = self.config.bb
         ctx.last_raise_seat = bb_seat
         ctx.pre_events.append(
@@ -188,21 +294,18 @@ class GameEngine:
         )
 
     def _setup_betting_round(self, ctx: HandContext, preflop: bool) -> None:
-        ctx.pending_callers.clear()
-        ctx.actor_queue.clear()
-
-        actionable = [seat.seat for seat in self.seats if seat and not seat.has_folded and seat.stack > 0]
-        ctx.pending_callers.update(actionable)
+        ctx.pending_callers_mask = ctx.in_hand_mask & ~ctx.folded_mask & ~ctx.all_in_mask
+        actionable = _mask_seats(ctx.pending_callers_mask)
 
         if preflop:
-            active = [seat for seat in self.seats if seat and seat.stack > 0]
-            heads_up = len(active) == 2
+            heads_up = ctx.in_hand_mask.bit_count() == 2
             if heads_up and self.button is not None:
                 start_seat = self.button
             else:
-                start_seat = self._next_active_seat(ctx.last_raise_seat)  # seat after big blind
+                # Seat after the big blind.
+                start_seat = self._next_active_seat(ctx.last_raise_seat, ctx.pending_callers_mask)
         else:
-            start_seat = self._next_active_seat(ctx.button)
+            start_seat = self._next_active_seat(ctx.button, ctx.pending_callers_mask)
             ctx.current_bet = 0
             ctx.min_raise_increment = self.config.bb
             ctx.last_raise_seat = None
@@ -211,50 +314,37 @@ class GameEngine:
                 if seat:
                     seat.reset_for_round()
 
-        ctx.actor_queue.extend(self._rotation_from(start_seat))
+        ctx.rotation = self._rotation_from(ctx, start_seat)
+        ctx.actor_pos = 0
 
-    def _rotation_from(self, start: int) -> List[int]:
-        seats = []
-        idx = start % self.config.seats
-        for _ in range(self.config.seats):
-            seat = self.seats[idx]
-            if seat and not seat.has_folded:
-                seats.append(idx)
-            idx = (idx + 1) % self.config.seats
-        return seats
-
-    def _active_seats_starting_from(self, start: int) -> List[int]:
-        first = self._next_active_seat(start)
-        ordered = []
-        idx = first
-        while True:
-            seat = self.seats[idx]
-            if seat and seat.stack > 0 and not seat.has_folded:
-                ordered.append(idx)
-            idx = (idx + 1) % self.config.seats
-            if idx == first:
-                break
-        return ordered
-
-    def _next_active_seat(self, start: Optional[int]) -> int:
+    def _rotation_from(self, ctx: HandContext, start: int) -> List[int]:
+        live = ctx.in_hand_mask & ~ctx.folded_mask
+        return [idx for idx in self._rotations[start % self.config.seats] if live >> idx & 1]
+
+    def _next_active_seat(self, start: Optional[int], mask: Optional[int] = None) -> int:
+        # First seat after `start` whose bit is set in `mask`; by default, seats that can still act.
         if start is None:
             raise RuntimeError("No start seat defined")
-        idx = (start + 1) % self.config.seats
-        while True:
-            seat = self.seats[idx]
-            if seat and seat.stack > 0 and not seat.has_folded:
+        if mask is None:
+            ctx = self.hand
+            if ctx is not None:
+                mask = ctx.in_hand_mask & ~ctx.folded_mask & ~ctx.all_in_mask
+            else:
+                mask = self._stacked_mask()
+        for idx in self._rotations[(start + 1) % self.config.seats]:
+            if mask >> idx & 1:
                 return idx
-            idx = (idx + 1) % self.config.seats
-
-    def _commit_chips(self, seat: PlayerSeat, amount: int, ctx: HandContext) -> None:
-        amount = min(amount, seat.stack)
-        seat.stack -= amount
-        seat.committed += amount
-        seat.total_in_pot += amount
-        ctx.pot += amount
+        raise RuntimeError("No active seat")
 
     # Action handling -------------------------------------------------
-    def legal_actions(self, seat_idx: int) -> Tuple[List[ActionType], Optional[int], Optional[int], Optional[int]]:
+    def legal_actions(self, seat_idx: int) -> LegalActions:
+        return self._legal(seat_idx)[1]
+
+    def legal_action_mask(self, seat_idx: int) -> LegalMask:
+        """Like legal_actions, but the moves come back as FOLD_BIT | CHECK_BIT | ... flags."""
+        return self._legal(seat_idx)[2]
+
+    def _legal(self, seat_idx: int) -> Tuple[int, LegalActions, LegalMask]:
         if not self.hand:
             raise RuntimeError("Hand not in progress")
         ctx = self.hand
@@ -262,13 +352,17 @@ class GameEngine:
         if seat is None or seat.has_folded:
             raise RuntimeError("Seat not active")
 
-        # Return every legal move plus helper numbers (amount to call, min/max raise).
-        legal: List[ActionType] = [ActionType.FOLD]
+        cached = ctx.legal_cache.get(seat_idx)
+        if cached is not None and cached[0] == ctx.state_version:
+            return cached
+
+        # Every legal move plus helper numbers (amount to call, min/max raise).
+        mask = FOLD_BIT
         call_amount = ctx.current_bet - seat.committed
         if call_amount <= 0:
-            legal.append(ActionType.CHECK)
+            mask |= CHECK_BIT
         elif seat.stack > 0:
-            legal.append(ActionType.CALL)
+            mask |= CALL_BIT
         elif seat.stack == 0 and call_amount > 0:
             # All-in for less was already committed; nothing to do.
             call_amount = None
@@ -279,13 +373,22 @@ class GameEngine:
             min_raise_to = ctx.current_bet + ctx.min_raise_increment
             if seat.stack + seat.committed > min_raise_to:
                 max_raise_to = seat.stack + seat.committed
-                legal.append(ActionType.RAISE_TO)
+                mask |= RAISE_TO_BIT
             elif seat.stack + seat.committed > ctx.current_bet:
                 max_raise_to = seat.stack + seat.committed
                 min_raise_to = max_raise_to
-                legal.append(ActionType.RAISE_TO)
+                mask |= RAISE_TO_BIT
 
-        return legal, (call_amount if call_amount and call_amount > 0 else None), min_raise_to, max_raise_to
+        if not call_amount or call_amount < 0:
+            call_amount = None
+        legal = [action for bit, action in _ACTION_BITS if mask & bit]
+        entry = (
+            ctx.state_version,
+            (legal, call_amount, min_raise_to, max_raise_to),
+            (mask, call_amount, min_raise_to, max_raise_to),
+        )
+        ctx.legal_cache[seat_idx] = entry
+        return entry
 
     def apply_action(self, seat_idx: int, action: ActionType, amount: Optional[int]) -> List[Dict[str, object]]:
         if not self.hand:
@@ -300,19 +403,25 @@ class GameEngine:
         # Each branch records what happened so the server can broadcast it.
         if action == ActionType.FOLD:
             seat.has_folded = True
-            ctx.pending_callers.discard(seat_idx)
+            ctx.folded_mask |= 1 << seat_idx
+            ctx.pending_callers_mask &= ~(1 << seat_idx)
             events.append({"ev": "FOLD", "seat": seat_idx})
         elif action == ActionType.CHECK:
             if ctx.current_bet > seat.committed:
                 raise ValueError("Cannot check when facing a bet")
-            ctx.pending_callers.discard(seat_idx)
+            ctx.pending_callers_mask &= ~(1 << seat_idx)
             events.append({"ev": "CHECK", "seat": seat_idx})
         elif action == ActionType.CALL:
             call_amount = ctx.current_bet - seat.committed
             if call_amount <= 0:
                 raise ValueError("Nothing to call")
-            self._commit_chips(seat, call_amount, ctx)
-            ctx.pending_callers.discard(seat_idx)
+            # A stack shorter than the bet calls all-in for less.
+            paid = call_amount if call_amount < seat.stack else seat.stack
+            seat.stack -= paid
+            seat.committed += paid
+            seat.total_in_pot += paid
+            ctx.pot += paid
+            ctx.pending_callers_mask &= ~(1 << seat_idx)
             events.append({"ev": "CALL", "seat": seat_idx, "amount": call_amount})
         elif action == ActionType.RAISE_TO:
             if amount is None:
@@ -329,30 +438,32 @@ class GameEngine:
             if not short_all_in and amount < min_raise_to:
                 raise ValueError("Raise below minimum")
 
+            # Already bounded by the stack through max_raise_to above.
             additional = amount - seat.committed
-            self._commit_chips(seat, additional, ctx)
+            seat.stack -= additional
+            seat.committed += additional
+            seat.total_in_pot += additional
+            ctx.pot += additional
             previous_bet = ctx.current_bet
             ctx.current_bet = amount
             if not short_all_in:
                 ctx.min_raise_increment = amount - previous_bet
                 ctx.last_raise_seat = seat_idx
-            ctx.pending_callers = {
-                s
-                for s in self._active_seats()
-                if s != seat_idx and self.seats[s] and self.seats[s].stack > 0
-            }
+            ctx.pending_callers_mask = ctx.in_hand_mask & ~ctx.folded_mask & ~ctx.all_in_mask & ~(1 << seat_idx)
             events.append({"ev": "BET", "seat": seat_idx, "amount": additional})
         else:
             raise ValueError(f"Unsupported action {action}")
 
         if seat.stack == 0:
-            ctx.pending_callers.discard(seat_idx)
+            ctx.all_in_mask |= 1 << seat_idx
+            ctx.pending_callers_mask &= ~(1 << seat_idx)
 
-        events.extend(self._advance_after_action(ctx))
+        ctx.state_version += 1
+        self._advance_after_action(ctx, events)
         return events
 
-    def _advance_after_action(self, ctx: HandContext) -> List[Dict[str, object]]:
-        events: List[Dict[str, object]] = []
+    # The helpers below append to the events list owned by apply_action instead of returning their own.
+    def _advance_after_action(self, ctx: HandContext, events: List[Dict[str, object]]) -> None:
         active = self._active_seats()
         if len(active) == 1:
             winner_idx = active[0]
@@ -363,85 +474,45 @@ class GameEngine:
                 events.append({"ev": "POT_AWARD", "seat": winner_idx, "amount": ctx.pot})
                 ctx.pot = 0
             ctx.phase = Phase.SHOWDOWN
-            ctx.pending_callers.clear()
-            ctx.actor_queue.clear()
-            for seat in self.seats:
-                if seat:
-                    seat.committed = 0
-                    seat.total_in_pot = 0
-            return events
-
-        if ctx.actor_queue:
-            ctx.actor_queue.append(ctx.actor_queue.popleft())
-        while ctx.actor_queue:
-            next_seat = ctx.actor_queue[0]
-            seat = self.seats[next_seat]
-            if seat and not seat.has_folded and (seat.stack > 0 or ctx.current_bet > seat.committed):
-                break
-            ctx.actor_queue.popleft()
-
-        if not ctx.pending_callers:
-            events.extend(self._advance_phase(ctx))
+            self._clear_contributions(ctx)
+            return
 
-        return events
+        if ctx.rotation:
+            ctx.actor_pos = (ctx.actor_pos + 1) % len(ctx.rotation)
 
-    def _advance_phase(self, ctx: HandContext) -> List[Dict[str, object]]:
-        events: List[Dict[str, object]] = []
+        if not ctx.pending_callers_mask:
+            self._advance_phase(ctx, events)
 
-        def reveal(ev: str, cards: List[Card]) -> None:
-            events.append({"ev": ev, "cards": [card.label for card in cards]})
-
-        progressed = False
-        while True:
-            if ctx.phase == Phase.PRE_FLOP:
-                ctx.phase = Phase.FLOP
-                cards = deal(ctx.deck, 3)
-                ctx.community.extend(cards)
-                reveal("FLOP", cards)
-            elif ctx.phase == Phase.FLOP:
-                ctx.phase = Phase.TURN
-                cards = deal(ctx.deck, 1)
-                ctx.community.extend(cards)
-                events.append({"ev": "TURN", "card": cards[0].label})
-            elif ctx.phase == Phase.TURN:
-                ctx.phase = Phase.RIVER
-                cards = deal(ctx.deck, 1)
-                ctx.community.extend(cards)
-                events.append({"ev": "RIVER", "card": cards[0].label})
+    def _advance_phase(self, ctx: HandContext, events: List[Dict[str, object]]) -> None:
+        for seat_idx in self._active_seats():
+            seat = self.seats[seat_idx]
+            if seat:
+                seat.reset_for_round()
+        ctx.current_bet = 0
+        ctx.min_raise_increment = self.config.bb
+        ctx.last_raise_seat = None
+
+        # Betting only reopens when at least two seats still have chips; otherwise run out the board.
+        actionable = ctx.in_hand_mask & ~ctx.folded_mask & ~ctx.all_in_mask
+        while ctx.phase in _PHASE_TABLE:
+            next_phase, count, ev = _PHASE_TABLE[ctx.phase]
+            cards = deal(ctx.deck, count)
+            ctx.community.extend(cards)
+            labels = cards_to_labels(cards)
+            ctx.community_labels.extend(labels)
+            if count == 1:
+                events.append({"ev": ev, "card": labels[0]})
             else:
-                ctx.phase = Phase.SHOWDOWN
-                events.extend(self._resolve_showdown(ctx))
-                return events
-
-            progressed = True
-
-            for seat_idx in self._active_seats():
-                seat = self.seats[seat_idx]
-                if seat:
-                    seat.reset_for_round()
-
-            ctx.current_bet = 0
-            ctx.min_raise_increment = self.config.bb
-            ctx.last_raise_seat = None
-            ctx.pending_callers = {
-                s
-                for s in self._active_seats()
-                if self.seats[s] and self.seats[s].stack > 0
-            }
-            if ctx.pending_callers:
-                start = self._next_active_seat(ctx.button)
-                ctx.actor_queue = deque(self._rotation_from(start))
-                break
-
-            # No players with chips left → continue revealing to showdown.
-            if ctx.phase == Phase.SHOWDOWN:
-                break
-
-        if progressed and ctx.phase != Phase.SHOWDOWN:
-            # betting continues
-            return events
+                events.append({"ev": ev, "cards": labels})
+            ctx.phase = next_phase
+            if actionable & (actionable - 1):
+                ctx.pending_callers_mask = actionable
+                ctx.rotation = self._rotation_from(ctx, self._next_active_seat(ctx.button))
+                ctx.actor_pos = 0
+                return
 
-        return events
+        ctx.phase = Phase.SHOWDOWN
+        self._resolve_showdown(ctx, events)
 
     # Public/Snapshot helpers -----------------------------------------
     def lobby_state(self) -> Dict[str, object]:
@@ -485,12 +556,21 @@ class GameEngine:
     def next_actor(self) -> Optional[int]:
         if not self.hand:
             return None
-        while self.hand.actor_queue and (
-            (self.seats[self.hand.actor_queue[0]] is None)
-            or self.seats[self.hand.actor_queue[0]].has_folded
-        ):
-            self.hand.actor_queue.popleft()
-        return self.hand.actor_queue[0] if self.hand.actor_queue else None
+        ctx = self.hand
+        pending = ctx.pending_callers_mask
+        if not pending:
+            return None
+        # Walk the fixed rotation from the current position to the first seat still owing action.
+        rotation = ctx.rotation
+        count = len(rotation)
+        pos = ctx.actor_pos
+        for _ in range(count):
+            seat_idx = rotation[pos]
+            if pending >> seat_idx & 1:
+                ctx.actor_pos = pos
+                return seat_idx
+            pos = (pos + 1) % count
+        return None
 
     def act_payload(self, seat_idx: int) -> Dict[str, object]:
         if not self.hand:
@@ -511,19 +591,25 @@ class GameEngine:
             "current_bet": ctx.current_bet,
             "min_raise_increment": ctx.min_raise_increment,
             "you": {
-                "hole": list(seat.hole_cards),
+                "hole": cards_to_labels(seat.hole_cards),
                 "stack": seat.stack,
                 "committed": seat.committed,
                 "to_call": to_call,
                 "time_ms": self.config.move_time_ms,
             },
-            "table": {
-                "sb": self.config.sb,
-                "bb": self.config.bb,
-                "seats": self.config.seats,
-                "button": ctx.button,
-            },
-            "players": [
+            "table": dict(self._table_dict),
+            "players": self._players_view(ctx),
+            "community": list(ctx.community_labels),
+            "legal": [action.value for action in legal],
+            "call_amount": call_amount,
+            "min_raise_to": min_raise_to,
+            "max_raise_to": max_raise_to,
+        }
+
+    def _players_view(self, ctx: HandContext) -> List[Dict[str, object]]:
+        # Rows are rebuilt only when state_version moves; callers get copies they are free to edit.
+        if ctx.players_view_version != ctx.state_version:
+            ctx.players_view = [
                 {
                     "seat": idx,
                     "stack": s.stack,
@@ -532,13 +618,9 @@ class GameEngine:
                 }
                 for idx, s in enumerate(self.seats)
                 if s is not None
-            ],
-            "community": [card.label for card in ctx.community],
-            "legal": [action.value for action in legal],
-            "call_amount": call_amount,
-            "min_raise_to": min_raise_to,
-            "max_raise_to": max_raise_to,
-        }
+            ]
+            ctx.players_view_version = ctx.state_version
+        return [dict(row) for row in ctx.players_view]
 
     def snapshot_payload(self, seat_idx: int, time_ms_remaining: int) -> Dict[str, object]:
         if not self.hand:
@@ -556,21 +638,12 @@ class GameEngine:
             "phase": ctx.phase.value,
             "you": {
                 "seat": seat_idx,
-                "hole": list(seat.hole_cards),
+                "hole": cards_to_labels(seat.hole_cards),
                 "stack": seat.stack,
                 "to_call": max(ctx.current_bet - seat.committed, 0),
             },
-            "players": [
-                {
-                    "seat": idx,
-                    "stack": s.stack,
-                    "has_folded": s.has_folded,
-                    "committed": s.committed,
-                }
-                for idx, s in enumerate(self.seats)
-                if s is not None
-            ],
-            "community": [card.label for card in ctx.community],
+            "players": self._players_view(ctx),
+            "community": list(ctx.community_labels),
             "next_actor": next_actor,
             "time_ms_remaining": time_ms_remaining,
         }
@@ -598,7 +671,7 @@ class GameEngine:
                     "team": seat.team,
                     "stack": seat.stack,
                     "committed": seat.committed,
-                    "hole": list(seat.hole_cards),
+                    "hole": cards_to_labels(seat.hole_cards),
                     "has_folded": seat.has_folded,
                     "connected": seat.connected,
                     "is_button": ctx.button == idx if ctx.button is not None else False,
@@ -609,7 +682,7 @@ class GameEngine:
             "table_id": table_id,
             "pot": ctx.pot,
             "phase": ctx.phase.value,
-            "community": [card.label for card in ctx.community],
+            "community": list(ctx.community_labels),
             "seats": seats,
             "next_actor": next_actor,
             "time_remaining_ms": time_ms_remaining if next_actor is not None else None,
@@ -634,8 +707,7 @@ class GameEngine:
         return bool(self.hand and self.hand.phase == Phase.SHOWDOWN and self.hand.pot == 0)
 
     def is_match_over(self) -> bool:
-        active = [seat for seat in self.seats if seat and seat.stack > 0]
-        return len(active) <= 1
+        return self._stacked_mask().bit_count() <= 1
 
     def match_result_payload(self) -> Dict[str, object]:
         active = [seat for seat in self.seats if seat and seat.stack > 0]
@@ -649,24 +721,27 @@ class GameEngine:
             ],
         }
 
-    def _resolve_showdown(self, ctx: HandContext) -> List[Dict[str, object]]:
-        events: List[Dict[str, object]] = []
+    def _resolve_showdown(self, ctx: HandContext, events: List[Dict[str, object]]) -> None:
         board = list(ctx.community)
-        board_labels = [card.label for card in board]
+        board_labels = cards_to_labels(board)
 
-        scores: Dict[int, Tuple[int, List[int]]] = {}
+        scores: Dict[int, int] = {}
+        shown: List[int] = []
+        holes: List[List[Card]] = []
         for seat_idx in self._active_seats():
             seat = self.seats[seat_idx]
-            if seat is None or seat.has_folded:
-                continue
-            cards = parse_cards(seat.hole_cards) + board
-            score = evaluate_best(cards)
+            assert seat
+            shown.append(seat_idx)
+            holes.append(seat.hole_cards)
+
+        # One batched call scores every contender against the shared board.
+        for seat_idx, hole, score in zip(shown, holes, evaluate_board_batch(board, holes)):
             scores[seat_idx] = score
             events.append(
                 {
                     "ev": "SHOWDOWN",
                     "seat": seat_idx,
-                    "hand": list(seat.hole_cards),
+                    "hand": cards_to_labels(hole),
                     "board": board_labels,
                     "rank": describe_rank(score),
                 }
@@ -690,36 +765,45 @@ class GameEngine:
         for seat_idx in eliminated:
             events.append({"ev": "ELIMINATED", "seat": seat_idx})
 
-        ctx.pending_callers.clear()
-        ctx.actor_queue.clear()
-        for seat in self.seats:
+        self._clear_contributions(ctx)
+
+    def _clear_contributions(self, ctx: HandContext) -> None:
+        # Close out betting once the pot is paid; only seats dealt in can hold chips in it.
+        ctx.pending_callers_mask = 0
+        ctx.rotation = []
+        seats = self.seats
+        for seat_idx in _mask_seats(ctx.in_hand_mask):
+            seat = seats[seat_idx]
             if seat:
                 seat.committed = 0
                 seat.total_in_pot = 0
-        return events
 
     def _build_side_pots(self) -> List[Tuple[int, List[int]]]:
-        remaining: Dict[int, int] = {
-            seat_idx: seat.total_in_pot
+        # Each distinct contribution level closes a layer that every seat at or above it paid into.
+        entries = sorted(
+            (seat.total_in_pot, seat_idx)
             for seat_idx, seat in enumerate(self.seats)
             if seat and seat.total_in_pot > 0
-        }
+        )
 
+        folded = self.hand.folded_mask if self.hand else 0
         pots: List[Tuple[int, List[int]]] = []
-        while True:
-            active = [seat_idx for seat_idx, amount in remaining.items() if amount > 0]
-            if not active:
-                break
-            min_amount = min(remaining[seat_idx] for seat_idx in active)
-            eligible = list(active)
-            pot_total = 0
-            for seat_idx in eligible:
-                take = min(min_amount, remaining[seat_idx])
-                pot_total += take
-                remaining[seat_idx] -= take
-            contenders = [seat_idx for seat_idx in eligible if self.seats[seat_idx] and not self.seats[seat_idx].has_folded]
-            pots.append((pot_total, contenders))
+        prev = 0
+        count = len(entries)
+        for i, (amount, _) in enumerate(entries):
+            delta = amount - prev
+            if delta <= 0:
+                continue
+            contenders = sorted(
+                seat_idx for _, seat_idx in entries[i:] if not folded >> seat_idx & 1
+            )
+            pots.append((delta * (count - i), contenders))
+            prev = amount
         return pots
 
     def _active_seats(self) -> List[int]:
-        return [seat.seat for seat in self.seats if seat and not seat.has_folded]
+        # Seats dealt into the current hand that have not folded.
+        ctx = self.hand
+        if ctx is None:
+            return []
+        return _mask_seats(ctx.in_hand_mask & ~ctx.folded_mask)
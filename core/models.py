@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Dict, List, Optional
 
+from .cards import Card
+
 
 class Phase(str, Enum):
     PRE_FLOP = "PRE_FLOP"
@@ -20,7 +22,7 @@ class ActionType(str, Enum):
     RAISE_TO = "RAISE_TO"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TableConfig:
     seats: int = 6
     starting_stack: int = 10_000
@@ -30,7 +32,7 @@ class TableConfig:
     variant: str = "HUNL"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerSeat:
     seat: int
     team: str
@@ -40,7 +42,7 @@ class PlayerSeat:
     committed: int = 0
     total_in_pot: int = 0
     has_folded: bool = False
-    hole_cards: List[str] = field(default_factory=list)
+    hole_cards: List[Card] = field(default_factory=list)
 
     def reset_for_hand(self) -> None:
         self.committed = 0
@@ -52,18 +54,18 @@ class PlayerSeat:
         self.committed = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class LobbySnapshot:
     players: List[Dict[str, object]]
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     ev: str
     data: Dict[str, object] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionRequest:
     hand_id: str
     req_id: str
@@ -71,7 +73,7 @@ class ActionRequest:
     amount: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SeatActionWindow:
     legal: List[ActionType]
     call_amount: Optional[int]
@@ -79,7 +81,7 @@ class SeatActionWindow:
     max_raise_to: Optional[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class Snapshot:
     at_hand_id: str
     phase: Phase
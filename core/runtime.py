@@ -0,0 +1,18 @@
+"""Process plumbing shared by the hosts and scripts: the JSON encoder and the event-loop runner."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+try:
+    import uvloop
+except ImportError:  # optional: pip install poker-bot-arena[uvloop]
+    uvloop = None
+
+# Bound once: json.dumps builds a new encoder per call for non-default options. Compact separators
+# shrink each frame, and wire payloads are plain trees, never circular.
+json_encode = json.JSONEncoder(separators=(",", ":"), check_circular=False, ensure_ascii=False).encode
+
+# uvloop's C event loop speeds up socket-heavy serving; plain asyncio otherwise.
+run_event_loop = uvloop.run if uvloop is not None else asyncio.run
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import random
+from typing import List, Sequence
+
+from .cards import BASE_DECK, Card
+from .evaluator import evaluate_best_batch
+
+# Reseeded per hand so each result depends only on its own seed.
+_RNG = random.Random()
+
+
+def simulate_many(hole_cards: Sequence[Sequence[Card]], seeds: Sequence[int]) -> List[int]:
+    """Deal a random board for each two-card holding and return its showdown strength.
+
+    Hand ``i`` draws its five community cards with ``seeds[i]``, so results are
+    reproducible per hand regardless of batch size. No engine state is touched.
+    """
+    if len(hole_cards) != len(seeds):
+        raise ValueError("hole_cards and seeds must have the same length")
+
+    rng = _RNG
+    sample = rng.sample
+    hands: List[List[Card]] = []
+    for (first, second), seed in zip(hole_cards, seeds):
+        rng.seed(seed)
+        # Seven draws always leave at least five cards that are not in the holding.
+        board = [card for card in sample(BASE_DECK, 7) if card != first and card != second]
+        hands.append([first, second, *board[:5]])
+    return evaluate_best_batch(hands)
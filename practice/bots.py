@@ -1,58 +1,71 @@
 from __future__ import annotations
 
 import random
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
-from core.game import GameEngine
+from core.cards import Card
+from core.game import CALL_BIT, CHECK_BIT, FOLD_BIT, RAISE_TO_BIT, GameEngine
 from core.models import ActionType, Phase
 
 
 _RNG = random.Random()
-_RANK_POINTS = {rank: idx for idx, rank in enumerate("23456789TJQKA", start=2)}
-
-
-def _rough_hand_strength(hole: list[str]) -> int:
+# Bound once: every draw is then a single C call with no attribute lookup. Reseed through _RNG.
+_random = _RNG.random
+_EMPTY_HOLE: Tuple[Card, ...] = ()
+# Extra raise probability by street: more post-flop barreling.
+_PHASE_BONUS = {
+    Phase.PRE_FLOP: 0.0,
+    Phase.FLOP: 0.05,
+    Phase.TURN: 0.1,
+    Phase.RIVER: 0.12,
+}
+
+# facing_bet -> (min-raise below, shove above); rolls in between size the raise.
+_RAISE_BANDS = {False: (0.35, 0.9), True: (0.2, 0.85)}
+
+
+def _rough_hand_strength(hole: Sequence[Card]) -> int:
     """Very rough proxy for hand quality used to drive aggression choices."""
     if len(hole) < 2:
         return 0
 
-    ranks = [card[0] for card in hole]
-    suits = [card[1] for card in hole]
-    values = [_RANK_POINTS.get(rank, 2) for rank in ranks]
+    # Packed cards carry the rank index in bits 8-11 and the suit flag in bits 12-15.
+    c0 = hole[0]
+    c1 = hole[1]
+    v0 = ((c0 >> 8) & 0xF) + 2
+    v1 = ((c1 >> 8) & 0xF) + 2
 
-    score = sum(values)
-    if ranks[0] == ranks[1]:
+    score = v0 + v1
+    if v0 == v1:
         score += 14  # pairs are quite strong pre-flop
     else:
-        gap = abs(values[0] - values[1])
+        gap = v0 - v1 if v0 > v1 else v1 - v0
         if gap == 1:
             score += 4
         elif gap == 2:
             score += 2
-    if suits[0] == suits[1]:
+    if c0 & c1 & 0xF000:
         score += 3
-    if min(values) >= 11:
+    if v0 >= 11 and v1 >= 11:
         score += 2
 
     return score
 
 
 def _should_raise(strength: int, phase: Phase, facing_bet: bool) -> bool:
-    # Encourage more post-flop barreling and occasional light opens.
-    base = 0.2 if facing_bet else 0.35
-    phase_bonus = {
-        Phase.PRE_FLOP: 0.0,
-        Phase.FLOP: 0.05,
-        Phase.TURN: 0.1,
-        Phase.RIVER: 0.12,
-    }.get(phase, 0.0)
-    scaled_strength = min(strength / 45.0, 0.45)
-    probability = min(0.85, base + phase_bonus + scaled_strength)
-
     # Always attack with premium holdings.
     if strength >= 36:
         return True
-    return _RNG.random() < probability
+
+    # Encourage more post-flop barreling and occasional light opens.
+    base = 0.2 if facing_bet else 0.35
+    scaled_strength = strength / 45.0
+    if scaled_strength > 0.45:
+        scaled_strength = 0.45
+    probability = base + _PHASE_BONUS.get(phase, 0.0) + scaled_strength
+    if probability > 0.85:
+        probability = 0.85
+    return _random() < probability
 
 
 def _choose_raise_amount(
@@ -65,49 +78,43 @@ def _choose_raise_amount(
     if max_raise_to is None or max_raise_to <= min_raise_to:
         return min_raise_to
 
-    span = max_raise_to - min_raise_to
-    roll = _RNG.random()
-
     # Facing a bet → weight toward stronger responses, otherwise mix in more probes.
-    if facing_bet:
-        if roll < 0.2:
-            return min_raise_to
-        if roll > 0.85:
-            return max_raise_to
-    else:
-        if roll < 0.35:
-            return min_raise_to
-        if roll > 0.9:
-            return max_raise_to
-
-    return min_raise_to + int(span * _RNG.random())
+    low, high = _RAISE_BANDS[facing_bet]
+    roll = _random()
+    if roll < low:
+        return min_raise_to
+    if roll > high:
+        return max_raise_to
+    # A roll inside the band is uniform across it, so rescaling it stands in for a second draw.
+    return min_raise_to + int((max_raise_to - min_raise_to) * (roll - low) / (high - low))
 
 
 def baseline_strategy(engine: GameEngine, seat_idx: int) -> Tuple[ActionType, Optional[int]]:
     """Aggressive demo bot: mixes in random raises with a bias toward stronger holdings."""
 
-    legal, call_amount, min_raise_to, max_raise_to = engine.legal_actions(seat_idx)
+    legal, call_amount, min_raise_to, max_raise_to = engine.legal_action_mask(seat_idx)
 
     # Always fold if folding is only option.
-    if len(legal) == 1 and legal[0] == ActionType.FOLD:
+    if legal == FOLD_BIT:
         return ActionType.FOLD, None
 
-    seat = engine.seats[seat_idx]
-    hole = seat.hole_cards if seat else []
-    strength = _rough_hand_strength(hole)
-    phase = engine.hand.phase if engine.hand else Phase.PRE_FLOP
-    facing_bet = call_amount is not None
-
-    if ActionType.RAISE_TO in legal and hole and _should_raise(strength, phase, facing_bet):
-        amount = _choose_raise_amount(min_raise_to, max_raise_to, facing_bet)
-        return ActionType.RAISE_TO, amount
+    if legal & RAISE_TO_BIT:
+        seat = engine.seats[seat_idx]
+        hole = seat.hole_cards if seat else _EMPTY_HOLE
+        if hole:
+            hand = engine.hand
+            phase = hand.phase if hand is not None else Phase.PRE_FLOP
+            facing_bet = call_amount is not None
+            if _should_raise(_rough_hand_strength(hole), phase, facing_bet):
+                amount = _choose_raise_amount(min_raise_to, max_raise_to, facing_bet)
+                return ActionType.RAISE_TO, amount
 
     # Fall back to calling if legal.
-    if ActionType.CALL in legal:
+    if legal & CALL_BIT:
         return ActionType.CALL, None
 
     # Prefer checking when no chips are at risk and no raise happened.
-    if ActionType.CHECK in legal:
+    if legal & CHECK_BIT:
         return ActionType.CHECK, None
 
     return ActionType.FOLD, None
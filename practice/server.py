@@ -4,20 +4,50 @@ import argparse
 import asyncio
 import json
 import logging
-from dataclasses import dataclass, replace
-from typing import Any, Dict, List, Optional
+import operator
+from collections import deque
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Set
 
 import websockets
 from http import HTTPStatus
 
+try:
+    import msgpack
+except ImportError:  # optional: pip install poker-bot-arena[msgpack]
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # optional: pip install poker-bot-arena[orjson]
+    orjson = None
+
 from core.game import GameEngine
 from core.models import ActionType, TableConfig
+from core.runtime import json_encode, run_event_loop
 from practice.bots import baseline_strategy
 
 LOGGER = logging.getLogger("practice_host")
 
 AB_SEAT_ORDER = {"A": 0, "B": 1}
 
+# The engine settles every state change inside apply_action, so a hand with no actor
+# should never last; poll briefly, then give up rather than spin the event loop.
+IDLE_POLL_S = 0.01
+MAX_IDLE_POLLS = 100
+
+# Wire value -> ActionType without going through Enum.__call__ on every action.
+_ACTION_LOOKUP = {action.value: action for action in ActionType}
+
+# Largest frame accepted from a client.
+MAX_MESSAGE_BYTES = 64 * 1024
+
+# Wire encodings a client can ask for with hello["enc"] or the WebSocket subprotocol.
+ENCODINGS = ("json", "msgpack")
+# Offered during the WebSocket handshake; msgpack only when it can actually be spoken.
+SUBPROTOCOLS = ["msgpack", "json"] if msgpack is not None else ["json"]
+
 
 class PracticeServerError(Exception):
     def __init__(self, code: str, msg: str) -> None:
@@ -26,18 +56,49 @@ class PracticeServerError(Exception):
         self.msg = msg
 
 
-def _config_payload(config: TableConfig) -> Dict[str, Any]:
-    return {
-        "variant": config.variant,
-        "seats": config.seats,
-        "starting_stack": config.starting_stack,
-        "sb": config.sb,
-        "bb": config.bb,
+if orjson is not None:
+
+    def _encode_v1(payload: Dict[str, Any]) -> str:
+        # Splice the version field into the encoded object instead of copying the dict.
+        body = orjson.dumps(payload)
+        if len(body) > 2:
+            return (b'{"v":1,' + body[1:]).decode()
+        return '{"v":1}'
+
+    def _loads(raw: str | bytes) -> Any:
+        return orjson.loads(raw)
+
+else:
+
+    def _encode_v1(payload: Dict[str, Any]) -> str:
+        return json_encode({"v": 1, **payload})
+
+    def _loads(raw: str | bytes) -> Any:
+        return json.loads(raw)
+
+
+@lru_cache(maxsize=128)
+def _welcome_frame(config: TableConfig, seat: int, encoding: str) -> str | bytes:
+    # Welcomes only vary by table config, seat and encoding, so each connection reuses an encoded frame.
+    payload = {
+        "type": "welcome",
+        "table_id": "PRACTICE",
+        "seat": seat,
+        "config": {
+            "variant": config.variant,
+            "seats": config.seats,
+            "starting_stack": config.starting_stack,
+            "sb": config.sb,
+            "bb": config.bb,
+        },
     }
+    if encoding == "msgpack":
+        return msgpack.packb({"v": 1, **payload}, use_bin_type=True)
+    return _encode_v1(payload)
 
 
 async def _send_error(websocket: websockets.WebSocketServerProtocol, code: str, msg: str) -> None:
-    await websocket.send(json.dumps({"type": "error", "code": code, "msg": msg}))
+    await websocket.send(json_encode({"type": "error", "code": code, "msg": msg}))
 
 @dataclass
 class RemoteBotClient:
@@ -45,9 +106,59 @@ class RemoteBotClient:
     websocket: websockets.WebSocketServerProtocol
     preferred_seat: int = 0
     seat_idx: Optional[int] = None
+    encoding: str = "json"
+    # Set from hello["batch_events"]: multi-event updates arrive as one {"type": "events"} frame.
+    batch_events: bool = False
+    _packer: Any = field(default=None, init=False, repr=False)
+    # Outgoing frames waiting for this connection's writer task, which only runs while there are any.
+    _outbox: Deque[str | bytes] = field(default_factory=deque, init=False, repr=False)
+    _writer: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+    _send_failure: Optional[BaseException] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.encoding == "msgpack":
+            # One packer per connection so its internal buffer is reused across messages.
+            self._packer = msgpack.Packer(use_bin_type=True)
+
+    def encode(self, payload: Dict[str, Any]) -> str | bytes:
+        if self._packer is not None:
+            return self._packer.pack({"v": 1, **payload})
+        # JSON always goes out as a text frame, whichever encoder produced it.
+        return _encode_v1(payload)
+
+    def decode(self, raw: str | bytes) -> Any:
+        if self._packer is not None:
+            return msgpack.unpackb(raw, raw=False)
+        return _loads(raw)
+
+    def post(self, frame: str | bytes) -> None:
+        """Queue an encoded frame; the game loop never waits on this socket draining."""
+        if self._send_failure is not None:
+            raise self._send_failure
+        self._outbox.append(frame)
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._drain_outbox())
+
+    async def _drain_outbox(self) -> None:
+        outbox = self._outbox
+        try:
+            while outbox:
+                await self.websocket.send(outbox.popleft())
+        except Exception as exc:  # noqa: BLE001 - reported by the next post() or flush()
+            self._send_failure = exc
+            outbox.clear()
+        finally:
+            self._writer = None
+
+    async def flush(self) -> None:
+        """Wait until every queued frame has been handed to the socket."""
+        if self._writer is not None:
+            await asyncio.shield(self._writer)
+        if self._send_failure is not None:
+            raise self._send_failure
 
     async def send_json(self, payload: Dict[str, Any]) -> None:
-        await self.websocket.send(json.dumps({"v": 1, **payload}))
+        self.post(self.encode(payload))
 
 
 # Each incoming table run is coordinated through PracticeSession.
@@ -65,10 +176,13 @@ class PracticeSession:
         if not remote_players:
             raise ValueError("At least one remote player required")
         self.engine = GameEngine(config)
-        self.remote_players = list(remote_players)
+        # Kept in seat-preference order so seating can walk it directly.
+        self.remote_players = sorted(remote_players, key=operator.attrgetter("preferred_seat"))
         self.remote_by_seat: Dict[int, RemoteBotClient] = {}
         self.house_team = house_team
         self.house_seat: Optional[int] = None
+        # Events held back until a remote must see the table (its act prompt) or the hand ends.
+        self._pending_events: List[Dict[str, Any]] = []
 
     async def run(self) -> None:
         # One practice match = repeated hands until only one stack remains.
@@ -77,19 +191,26 @@ class PracticeSession:
             if not self.engine.can_start_hand():
                 break
             ctx = self.engine.start_hand()
-            await self._broadcast_json({"type": "start_hand", **self.engine.start_hand_payload(ctx)})
-            for event in self.engine.consume_pre_events():
-                await self._broadcast_json({"type": "event", **event})
+            # Engine payload builders return fresh dicts, so tag them in place rather than copying.
+            payload = self.engine.start_hand_payload(ctx)
+            payload["type"] = "start_hand"
+            await self._broadcast_json(payload)
+            self._pending_events.extend(self.engine.consume_pre_events())
             await self._play_hand()
 
-        await self._broadcast_json({"type": "match_end", **self.engine.match_result_payload()})
+        payload = self.engine.match_result_payload()
+        payload["type"] = "match_end"
+        await self._broadcast_json(payload)
+        # The connection closes once the session returns; make sure match_end went out first.
+        for remote in self.remote_players:
+            await remote.flush()
 
     async def _assign_seats(self) -> None:
         needed = len(self.remote_players) + 1
         if needed > self.engine.config.seats:
             raise RuntimeError("Table config does not have enough seats")
 
-        for remote in sorted(self.remote_players, key=lambda r: r.preferred_seat):
+        for remote in self.remote_players:
             seat = self.engine.assign_seat(remote.team_label)
             remote.seat_idx = seat.seat
             self.remote_by_seat[seat.seat] = remote
@@ -98,42 +219,101 @@ class PracticeSession:
         self.house_seat = house.seat
 
     async def _play_hand(self) -> None:
-        assert self.house_seat is not None
-        while not self.engine.is_hand_complete():
-            seat_idx = self.engine.next_actor()
+        house_seat = self.house_seat
+        assert house_seat is not None
+        engine = self.engine
+        idle_polls = 0
+        while not engine.is_hand_complete():
+            seat_idx = engine.next_actor()
+            # House bot is instant and runs locally: play out its turns back to back with no
+            # await, queueing their events for whichever remote is prompted next.
+            while seat_idx == house_seat:
+                action, amount = baseline_strategy(engine, seat_idx)
+                self._pending_events.extend(engine.apply_action(seat_idx, action, amount))
+                seat_idx = engine.next_actor()
             if seat_idx is None:
-                await asyncio.sleep(0)
+                if engine.is_hand_complete():
+                    break
+                idle_polls += 1
+                if idle_polls > MAX_IDLE_POLLS:
+                    raise RuntimeError("Hand stalled: no seat to act and hand not complete")
+                await asyncio.sleep(IDLE_POLL_S)
                 continue
+            idle_polls = 0
 
-            remote = self.remote_by_seat.get(seat_idx)
-            if remote is not None:
-                action, amount = await self._prompt_remote(remote)
-            else:
-                # House bot is instant and runs locally.
-                action, amount = baseline_strategy(self.engine, seat_idx)
-
-            events = self.engine.apply_action(seat_idx, action, amount)
-            for event in events:
-                await self._broadcast_json({"type": "event", **event})
+            remote = self.remote_by_seat[seat_idx]
+            await self._flush_events()
+            action, amount = await self._prompt_remote(remote)
+            self._pending_events.extend(engine.apply_action(seat_idx, action, amount))
 
-        await self._broadcast_json(self.engine.end_hand_payload() | {"type": "end_hand"})
+        await self._flush_events()
+        payload = self.engine.end_hand_payload()
+        payload["type"] = "end_hand"
+        await self._broadcast_json(payload)
 
     async def _prompt_remote(self, remote: RemoteBotClient) -> tuple[ActionType, Optional[int]]:
         assert remote.seat_idx is not None
         payload = self.engine.act_payload(remote.seat_idx)
-        await remote.send_json({"type": "act", **payload})
+        payload["type"] = "act"
+        await remote.send_json(payload)
+        # A well-behaved bot answers with exactly one action frame, so decode the first reply
+        # straight away; anything else drops to the filtered loop below.
+        message = remote.decode(await remote.websocket.recv())
+        while True:
+            if message.get("type") == "action":
+                action_name = message.get("action")
+                action = _ACTION_LOOKUP.get(action_name) if isinstance(action_name, str) else None
+                if action is not None:
+                    return action, message.get("amount")
+                # Same code the tournament host uses; the bot can retry within this prompt.
+                await remote.send_json({"type": "error", "code": "INVALID_ACTION", "msg": "Unknown action"})
+            message = await self._recv_action_message(remote)
+
+    async def _recv_action_message(self, remote: RemoteBotClient) -> Dict[str, Any]:
         while True:
             raw = await remote.websocket.recv()
-            message = json.loads(raw)
-            if message.get("type") != "action":
+            # Every action message contains the word "action"; skip anything else unparsed.
+            if isinstance(raw, str):
+                if '"action"' not in raw:
+                    continue
+            elif b"action" not in raw:
                 continue
-            action = ActionType(message["action"])
-            amount = message.get("amount")
-            return action, amount
+            return remote.decode(raw)
+
+    async def _flush_events(self) -> None:
+        if self._pending_events:
+            events = self._pending_events
+            self._pending_events = []
+            await self._broadcast_events(events)
+
+    async def _broadcast_events(self, events: List[Dict[str, Any]]) -> None:
+        # A lone event keeps its plain frame; clients that opted in get several as one "events" frame.
+        # The engine hands over fresh event dicts, so tag them in place rather than copying each one.
+        for event in events:
+            event["type"] = "event"
+        plain = self.remote_players
+        if len(events) > 1:
+            batched = [remote for remote in plain if remote.batch_events]
+            if batched:
+                # encode() only versions the outer frame; items carry "v" like the plain event frames.
+                items = [{"v": 1, **event} for event in events]
+                await self._broadcast_json({"type": "events", "items": items}, batched)
+                plain = [remote for remote in plain if not remote.batch_events]
+        if plain:
+            for event in events:
+                await self._broadcast_json(event, plain)
 
-    async def _broadcast_json(self, payload: Dict[str, Any]) -> None:
-        for remote in self.remote_players:
-            await remote.send_json(payload)
+    async def _broadcast_json(self, payload: Dict[str, Any], remotes: Optional[List[RemoteBotClient]] = None) -> None:
+        if remotes is None:
+            remotes = self.remote_players
+        # Encode once per wire encoding in use, not once per remote. Each remote's writer
+        # drains its own queue, so a slow socket never holds back the others.
+        frames: Dict[str, str | bytes] = {}
+        for remote in remotes:
+            frame = frames.get(remote.encoding)
+            if frame is None:
+                frame = frames[remote.encoding] = remote.encode(payload)
+            remote.post(frame)
 
 
 class ABTable:
@@ -142,11 +322,12 @@ class ABTable:
         self.team_key = team_key
         self.config = config
         self.bots: Dict[str, RemoteBotClient] = {}
-        self.wait_tasks: Dict[str, asyncio.Task] = {}
         self.session_task: Optional[asyncio.Task] = None
         self.done_event = asyncio.Event()
         self.lock = asyncio.Lock()
         self.session_starting = False
+        # Strong references to the wait_closed() tasks of bots still waiting for a partner.
+        self.close_watchers: Set[asyncio.Task] = set()
 
     def should_remove(self) -> bool:
         if self.done_event.is_set():
@@ -173,19 +354,11 @@ class ABTable:
             self.bots[upper_label] = remote
             if len(self.bots) == len(AB_SEAT_ORDER):
                 self.session_starting = True
-                for task in self.wait_tasks.values():
-                    task.cancel()
-                self.wait_tasks.clear()
                 start_session = True
             else:
-                self.wait_tasks[upper_label] = asyncio.create_task(self._wait_for_disconnect(remote, upper_label))
+                self._watch_disconnect(remote, upper_label)
 
-        await remote.send_json({
-            "type": "welcome",
-            "table_id": "PRACTICE",
-            "seat": remote.preferred_seat,
-            "config": _config_payload(self.config),
-        })
+        remote.post(_welcome_frame(self.config, remote.preferred_seat, remote.encoding))
 
         if start_session:
             self.session_task = asyncio.create_task(self._run_session())
@@ -200,7 +373,8 @@ class ABTable:
         await self._wait_for_completion(remote)
 
     async def _run_session(self) -> None:
-        remotes = sorted(self.bots.values(), key=lambda r: r.preferred_seat)
+        # AB_SEAT_ORDER lists the labels in seat order.
+        remotes = [self.bots[label] for label in AB_SEAT_ORDER if label in self.bots]
         session = PracticeSession(self.config, remotes, house_team=f"{self.team} (HOUSE)")
         try:
             await session.run()
@@ -210,18 +384,24 @@ class ABTable:
         finally:
             self.done_event.set()
 
-    async def _wait_for_disconnect(self, remote: RemoteBotClient, label: str) -> None:
-        try:
-            await remote.websocket.wait_closed()
-        except asyncio.CancelledError:
-            return
-        except Exception:  # noqa: BLE001
-            pass
-        async with self.lock:
-            self.wait_tasks.pop(label, None)
-            can_remove = (self.session_task is None) and (not self.session_starting)
-            if can_remove and self.bots.get(label) is remote:
-                self.bots.pop(label, None)
+    def _watch_disconnect(self, remote: RemoteBotClient, label: str) -> None:
+        # The task only waits for the close; its done-callback frees the slot, so nothing has to
+        # cancel it when the partner arrives.
+        watcher = asyncio.create_task(remote.websocket.wait_closed())
+        self.close_watchers.add(watcher)
+        watcher.add_done_callback(lambda task: self._on_waiting_bot_closed(task, remote, label))
+
+    def _on_waiting_bot_closed(self, task: asyncio.Task, remote: RemoteBotClient, label: str) -> None:
+        self.close_watchers.discard(task)
+        if not task.cancelled():
+            self._drop_waiting_bot(remote, label)
+
+    def _drop_waiting_bot(self, remote: RemoteBotClient, label: str) -> None:
+        # Runs on the event loop between awaits, so it cannot interleave with a locked section.
+        # Once the session is starting or running the slot stays reserved.
+        can_remove = (self.session_task is None) and (not self.session_starting)
+        if can_remove and self.bots.get(label) is remote:
+            self.bots.pop(label, None)
 
     async def _wait_for_completion(self, remote: RemoteBotClient) -> None:
         wait_done = asyncio.create_task(self.done_event.wait())
@@ -250,7 +430,14 @@ class ABTableManager:
         self.tables: Dict[str, ABTable] = {}
         self.lock = asyncio.Lock()
 
-    async def attach(self, team: str, websocket: websockets.WebSocketServerProtocol, bot_label: str) -> None:
+    async def attach(
+        self,
+        team: str,
+        websocket: websockets.WebSocketServerProtocol,
+        bot_label: str,
+        encoding: str = "json",
+        batch_events: bool = False,
+    ) -> None:
         team_display = team or "REMOTE"
         team_key = team_display.strip().casefold()
         async with self.lock:
@@ -261,7 +448,13 @@ class ABTableManager:
                 self.tables[team_key] = table
             team_display = table.team
         try:
-            await table.attach(bot_label, RemoteBotClient(team_label=team_display, websocket=websocket))
+            remote = RemoteBotClient(
+                team_label=team_display,
+                websocket=websocket,
+                encoding=encoding,
+                batch_events=batch_events,
+            )
+            await table.attach(bot_label, remote)
         finally:
             if table.should_remove():
                 async with self.lock:
@@ -277,16 +470,31 @@ async def handle_connection(
 ) -> None:
     # Basic handshake using same protocol fields.
     hello_raw = await websocket.recv()
-    hello = json.loads(hello_raw)
+    # A client that negotiated the msgpack subprotocol may send its hello as a binary frame too.
+    subprotocol = websocket.subprotocol
+    if subprotocol == "msgpack" and isinstance(hello_raw, bytes):
+        hello = msgpack.unpackb(hello_raw, raw=False)
+    else:
+        hello = _loads(hello_raw)
     if hello.get("type") != "hello":
         await _send_error(websocket, "BAD_HELLO", "Expected hello")
         return
 
+    encoding = hello.get("enc", subprotocol or "json")
+    if encoding not in ENCODINGS:
+        await _send_error(websocket, "BAD_ENCODING", f"enc must be one of {', '.join(ENCODINGS)}")
+        return
+    if encoding == "msgpack" and msgpack is None:
+        await _send_error(websocket, "BAD_ENCODING", "msgpack is not installed on this server")
+        return
+
     team_raw = hello.get("team")
     team = team_raw.strip() if isinstance(team_raw, str) else "REMOTE"
     if not team:
         team = "REMOTE"
 
+    batch_events = hello.get("batch_events") is True
+
     bot_label: Optional[str] = None
     if "bot" in hello:
         bot_raw = hello.get("bot")
@@ -304,20 +512,21 @@ async def handle_connection(
 
     if bot_label:
         try:
-            await ab_manager.attach(team, websocket, bot_label)
+            await ab_manager.attach(team, websocket, bot_label, encoding, batch_events)
         except PracticeServerError as exc:
             await _send_error(websocket, exc.code, exc.msg)
         except Exception as exc:  # noqa: BLE001
             LOGGER.exception("Practice A/B session crashed for %s (%s): %s", team, bot_label, exc)
         return
 
-    remote = RemoteBotClient(team_label=team, websocket=websocket, preferred_seat=0)
-    await remote.send_json({
-        "type": "welcome",
-        "table_id": "PRACTICE",
-        "seat": remote.preferred_seat,
-        "config": _config_payload(config),
-    })
+    remote = RemoteBotClient(
+        team_label=team,
+        websocket=websocket,
+        preferred_seat=0,
+        encoding=encoding,
+        batch_events=batch_events,
+    )
+    remote.post(_welcome_frame(config, remote.preferred_seat, remote.encoding))
 
     session = PracticeSession(config, [remote])
     try:
@@ -326,6 +535,21 @@ async def handle_connection(
         LOGGER.exception("Practice session crashed: %s", exc)
 
 
+def _plain_text_response(status: HTTPStatus, body: bytes) -> tuple[HTTPStatus, List[tuple[str, str]], bytes]:
+    headers = [
+        ("Content-Type", "text/plain; charset=utf-8"),
+        ("Content-Length", str(len(body))),
+    ]
+    return status, headers, body
+
+
+# Built once: websockets copies the headers into its own Headers object for every response,
+# so health probes can share these.
+_HEALTH_RESPONSE = _plain_text_response(HTTPStatus.OK, b"practice server running\n")
+_NOT_FOUND_RESPONSE = _plain_text_response(HTTPStatus.NOT_FOUND, b"not found\n")
+_HEALTH_PATHS = frozenset({"/", "/health", "/healthz"})
+
+
 async def _process_request(path, request_headers):
     """Return a simple HTTP response for health checks."""
 
@@ -333,19 +557,9 @@ async def _process_request(path, request_headers):
     if upgrade_header == "websocket":
         return None  # let the WebSocket handshake continue
 
-    if path in {"/", "/health", "/healthz"}:
-        body = b"practice server running\n"
-        headers = [
-            ("Content-Type", "text/plain; charset=utf-8"),
-            ("Content-Length", str(len(body))),
-        ]
-        return HTTPStatus.OK, headers, body
-    body = b"not found\n"
-    headers = [
-        ("Content-Type", "text/plain; charset=utf-8"),
-        ("Content-Length", str(len(body))),
-    ]
-    return HTTPStatus.NOT_FOUND, headers, body
+    if path in _HEALTH_PATHS:
+        return _HEALTH_RESPONSE
+    return _NOT_FOUND_RESPONSE
 
 
 async def run_server(host: str, port: int, config: TableConfig) -> None:
@@ -354,7 +568,20 @@ async def run_server(host: str, port: int, config: TableConfig) -> None:
     async def _handler(ws):
         await handle_connection(ws, config, ab_manager)
 
-    async with websockets.serve(_handler, host, port, process_request=_process_request):
+    # Frames here are small JSON control messages: permessage-deflate costs more CPU than it saves
+    # on the wire, and nothing a bot sends comes close to 64 KiB.
+    # Nagle is already off: asyncio (and uvloop) set TCP_NODELAY on every TCP transport.
+    async with websockets.serve(
+        _handler,
+        host,
+        port,
+        process_request=_process_request,
+        subprotocols=SUBPROTOCOLS,
+        compression=None,
+        max_size=MAX_MESSAGE_BYTES,
+        ping_interval=20,
+        ping_timeout=20,
+    ):
         LOGGER.info("Practice server listening on %s:%s", host, port)
         await asyncio.Future()
 
@@ -369,7 +596,7 @@ def main() -> None:
     args = parser.parse_args()
 
     config = TableConfig(seats=2, starting_stack=args.starting_stack, sb=args.sb, bb=args.bb)
-    asyncio.run(run_server(args.host, args.port, config))
+    run_event_loop(run_server(args.host, args.port, config))
 
 
 if __name__ == "__main__":
@@ -31,11 +31,69 @@ import argparse
 import asyncio
 import json
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
 
 import websockets
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; the stdlib json module works the same way here
+    orjson = None
+
+if orjson is not None:
+
+    def _dumps(payload: Dict[str, Any]) -> bytes:
+        # Sent as-is, so the JSON goes out as a binary frame: no str round-trip here and no
+        # UTF-8 validation on the host, which parses bytes directly.
+        return orjson.dumps(payload)
+
+    _loads = orjson.loads
+else:
+    # This template runs without the repo installed, so it keeps its own copy of core.runtime's encoder.
+    _dumps = json.JSONEncoder(separators=(",", ":"), check_circular=False, ensure_ascii=False).encode
+    _loads = json.JSONDecoder().decode
+
+try:
+    import msgpack
+except ImportError:  # only needed for --msgpack
+    msgpack = None
+
+try:
+    import uvloop
+except ImportError:  # optional faster event loop
+    uvloop = None
+
+
+def encoder_for(websocket: websockets.WebSocketClientProtocol) -> Callable[[Dict[str, Any]], Any]:
+    """MessagePack frames if the host accepted the msgpack subprotocol, else JSON."""
+
+    if websocket.subprotocol == "msgpack":
+        return msgpack.Packer(use_bin_type=True).pack
+    return _dumps
+
+
+# Action replies always have this shape, so with orjson (which already sends binary JSON frames)
+# they fill in a bytes template instead of building a dict and running the encoder. Without it the
+# dict path keeps them text frames. Action names are plain ASCII ("CALL", "RAISE_TO", ...).
+_ACTION_FRAME = b'{"type":"action","v":1,"hand_id":%b,"action":"%b"}'
+_ACTION_FRAME_WITH_AMOUNT = b'{"type":"action","v":1,"hand_id":%b,"action":"%b","amount":%d}'
+
+
+@lru_cache(maxsize=4)
+def _json_string(text: str) -> bytes:
+    # Quoted and escaped once per hand id; json.dumps escapes to plain ASCII.
+    return json.dumps(text).encode()
+
+
+def action_frame(hand_id: str, action: str, amount: Optional[int]) -> bytes:
+    """Encode an action reply as JSON bytes without building the payload dict."""
+
+    if amount is None:
+        return _ACTION_FRAME % (_json_string(hand_id), action.encode())
+    return _ACTION_FRAME_WITH_AMOUNT % (_json_string(hand_id), action.encode(), amount)
+
 LOGGER = logging.getLogger("sample_bot")
 STREAM_HANDLER = logging.StreamHandler()
 STREAM_HANDLER.setFormatter(logging.Formatter("%(message)s"))
@@ -45,9 +103,23 @@ LOGGER.propagate = False
 
 USE_UNICODE_CARDS = True
 SUIT_SYMBOLS = {"c": "♣", "d": "♦", "h": "♥", "s": "♠"}
+# Every card the host can send, already rendered with its unicode suit.
+RENDER_CACHE = {rank + suit: rank + symbol for rank in "23456789TJQKA" for suit, symbol in SUIT_SYMBOLS.items()}
+
+# One bit per legal action (same values as the host engine), so `ctx.legal_mask & CHECK_BIT`
+# is a single integer test instead of scanning the ctx.legal list.
+FOLD_BIT = 1
+CHECK_BIT = 2
+CALL_BIT = 4
+RAISE_TO_BIT = 8
+LEGAL_BITS = {"FOLD": FOLD_BIT, "CHECK": CHECK_BIT, "CALL": CALL_BIT, "RAISE_TO": RAISE_TO_BIT}
+
+# Hand-recap wording, built once rather than per event.
+_VERBS = {"BET": "bets", "CALL": "calls", "CHECK": "checks", "FOLD": "folds"}
+_PHASE_LABEL = {"PRE_FLOP": "PRE", "FLOP": "FLOP", "TURN": "TURN", "RIVER": "RIVER", "SHOWDOWN": "SHOW"}
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionContext:
     # Hand identification
     hand_id: str
@@ -84,6 +156,15 @@ class ActionContext:
     # Time remaining
     time_ms: int  # Time remaining to make decision
 
+    # Bitmask of `legal` (FOLD_BIT | CHECK_BIT | ...), filled in from `legal` on construction
+    legal_mask: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        mask = 0
+        for name in self.legal:
+            mask |= LEGAL_BITS.get(name, 0)
+        self.legal_mask = mask
+
 
 def choose_action(ctx: ActionContext) -> Tuple[str, Optional[int]]:
     """
@@ -97,26 +178,32 @@ def choose_action(ctx: ActionContext) -> Tuple[str, Optional[int]]:
     - ctx.current_bet: Current highest bet
     - ctx.players: List of all players with their stacks, fold status, and committed amounts
     - ctx.button, ctx.sb, ctx.bb: Table configuration
+    - ctx.legal_mask: Legal actions as bits (e.g., ctx.legal_mask & CHECK_BIT)
     - And all other fields in ActionContext
     
     Replace this function with your custom strategy!
     """
 
+    legal = ctx.legal_mask
+    call = ctx.call_amount or 0
+
     # Training wheels strategy: check → call small → fold.
     # Prefer checking whenever it is free.
-    if "CHECK" in ctx.legal:
+    if legal & CHECK_BIT:
         return "CHECK", None
 
     # Call small bets to see cheap showdowns.
-    if "CALL" in ctx.legal and (ctx.call_amount or 0) <= 200:
+    if legal & CALL_BIT and call <= 200:
         return "CALL", None
 
-    if "RAISE_TO" in ctx.legal and ctx.min_raise_to:
-        available = ctx.stack + (ctx.call_amount or 0)
-        min_total = (ctx.call_amount or 0) + ctx.committed
-        if available < ctx.min_raise_to or available <= min_total:
-            return "CALL" if "CALL" in ctx.legal else ("CHECK" if "CHECK" in ctx.legal else "FOLD"), None
-        target = max(ctx.min_raise_to, min_total)
+    min_raise_to = ctx.min_raise_to
+    if legal & RAISE_TO_BIT and min_raise_to:
+        available = ctx.stack + call
+        min_total = call + ctx.committed
+        if available < min_raise_to or available <= min_total:
+            # CHECK was ruled out above, so calling is the only alternative to folding.
+            return "CALL" if legal & CALL_BIT else "FOLD", None
+        target = max(min_raise_to, min_total)
         target = min(target, available)
         return "RAISE_TO", target
 
@@ -126,11 +213,12 @@ def choose_action(ctx: ActionContext) -> Tuple[str, Optional[int]]:
 def fallback_action(ctx: ActionContext) -> Tuple[str, Optional[int]]:
     """Select the safest legal move (check > call > fold > first legal)."""
 
-    if "CHECK" in ctx.legal:
+    mask = ctx.legal_mask
+    if mask & CHECK_BIT:
         return "CHECK", None
-    if "CALL" in ctx.legal:
+    if mask & CALL_BIT:
         return "CALL", None
-    if "FOLD" in ctx.legal:
+    if mask & FOLD_BIT:
         return "FOLD", None
     if ctx.legal:
         return ctx.legal[0], None
@@ -168,11 +256,11 @@ def sanitize_action(action: str, amount: Optional[int], ctx: ActionContext) -> T
             return fallback_action(ctx)
         return action, int(amount)
 
-    if action == "CALL" and "CALL" not in ctx.legal:
+    if action == "CALL" and not ctx.legal_mask & CALL_BIT:
         LOGGER.warning("CALL chosen but not legal; falling back")
         return fallback_action(ctx)
 
-    if action == "CHECK" and "CHECK" not in ctx.legal:
+    if action == "CHECK" and not ctx.legal_mask & CHECK_BIT:
         LOGGER.warning("CHECK chosen but not legal; falling back")
         return fallback_action(ctx)
 
@@ -187,6 +275,11 @@ async def play_hand(
     """Listen for host messages, respond to act prompts, and log hand summaries."""
 
     display_name = f"{team_name} ({bot_label})" if bot_label else team_name
+    encode = encoder_for(websocket)
+    template_frames = orjson is not None and websocket.subprotocol != "msgpack"
+    # With --log-level WARNING or above the recap is never printed, so don't build it.
+    info_on = LOGGER.isEnabledFor(logging.INFO)
+    debug_on = LOGGER.isEnabledFor(logging.DEBUG)
 
     state: Dict[str, Any] = {
         "seat": None,
@@ -200,21 +293,28 @@ async def play_hand(
         "team_display": display_name,
         "bot_label": bot_label,
         "seat_map": {},
+        # seat -> formatted label; register_seat clears it whenever the seating may have changed.
+        "seat_labels": {},
     }
 
     def set_phase(raw_phase: Optional[str]) -> None:
         if not raw_phase:
             return
         state["phase"] = raw_phase
-        state["phase_label"] = {
-            "PRE_FLOP": "PRE",
-            "FLOP": "FLOP",
-            "TURN": "TURN",
-            "RIVER": "RIVER",
-            "SHOWDOWN": "SHOW",
-        }.get(raw_phase, raw_phase)
+        state["phase_label"] = _PHASE_LABEL.get(raw_phase, raw_phase)
+
+    # register_seat only ever clears this dict, so the closure can hold on to it.
+    labels = state["seat_labels"]
 
     def seat_label(seat: Optional[int]) -> str:
+        # The recap names the same few seats over and over, so format each one once. In heads-up
+        # play that is just our own label and the opponent's.
+        label = labels.get(seat)
+        if label is None:
+            label = labels[seat] = describe_seat(seat)
+        return label
+
+    def describe_seat(seat: Optional[int]) -> str:
         if seat is None:
             return "Seat ?"
         if seat == state.get("seat"):
@@ -238,15 +338,13 @@ async def play_hand(
             for entry in stacks
         )
 
-    async for raw in websocket:
-        message = json.loads(raw)
-        msg_type = message.get("type")
-
-        if msg_type == "welcome":
-            state["seat"] = message.get("seat")
-            cfg = message.get("config", {})
-            state["seat_count"] = cfg.get("seats")
-            register_seat(state, state["seat"], state.get("team_display"))
+    # One handler per message type; each returns True when the match is over.
+    async def on_welcome(message: Dict[str, Any]) -> bool:
+        state["seat"] = message.get("seat")
+        cfg = message.get("config", {})
+        state["seat_count"] = cfg.get("seats")
+        register_seat(state, state["seat"], state.get("team_display"))
+        if info_on:
             LOGGER.info(
                 "[welcome] seat %s | variant=%s seats=%s sb=%s bb=%s",
                 seat_label(state["seat"]),
@@ -255,243 +353,299 @@ async def play_hand(
                 cfg.get("sb"),
                 cfg.get("bb"),
             )
-            continue
-
-        if msg_type == "ab_status":
-            LOGGER.info(
-                "[practice] waiting for partner | bot=%s state=%s",
-                message.get("bot"),
-                message.get("state"),
-            )
-            continue
+        return False
 
-        if msg_type == "start_hand":
-            # Reset per-hand state and record baseline info for the recap.
-            state["hand_id"] = message.get("hand_id")
-            set_phase("PRE_FLOP")
-            log = {
-                "hand_id": state["hand_id"],
-                "button": message.get("button"),
-                "start_stacks": message.get("stacks", []),
-                "actions": {"PRE": [], "FLOP": [], "TURN": [], "RIVER": []},
-                "board": [],
-                "board_by_phase": {},
-                "showdown": [],
-                "payouts": [],
-                "eliminations": [],
+    async def on_ab_status(message: Dict[str, Any]) -> bool:
+        LOGGER.info(
+            "[practice] waiting for partner | bot=%s state=%s",
+            message.get("bot"),
+            message.get("state"),
+        )
+        return False
+
+    async def on_start_hand(message: Dict[str, Any]) -> bool:
+        # Reset per-hand state and record baseline info for the recap.
+        state["hand_id"] = message.get("hand_id")
+        set_phase("PRE_FLOP")
+        if not info_on:
+            # hand_log stays None, so events are ignored until the next hand.
+            return False
+        log = {
+            "hand_id": state["hand_id"],
+            "button": message.get("button"),
+            "start_stacks": message.get("stacks", []),
+            "actions": {"PRE": [], "FLOP": [], "TURN": [], "RIVER": []},
+            "board": [],
+            "board_by_phase": {},
+            "showdown": [],
+            "payouts": [],
+            "eliminations": [],
+        }
+        state["hand_log"] = log
+        LOGGER.info(
+            "[hand %s] start | button %s | stacks %s",
+            state["hand_id"],
+            seat_label(log["button"]),
+            format_stacks(log["start_stacks"]),
+        )
+        return False
+
+    async def on_lobby(message: Dict[str, Any]) -> bool:
+        # Keep track of player names when the host sends lobby updates.
+        players = message.get("players", [])
+        for player in players:
+            register_seat(state, player.get("seat"), player.get("team"))
+        return False
+
+    # Table events, recorded to replay later in the summary.
+    def ev_post_blinds(log: Dict[str, Any], message: Dict[str, Any]) -> None:
+        log["actions"]["PRE"].append(f"{seat_label(message.get('sb_seat'))} posts SB {message.get('sb')}")
+        log["actions"]["PRE"].append(f"{seat_label(message.get('bb_seat'))} posts BB {message.get('bb')}")
+
+    def ev_action(log: Dict[str, Any], message: Dict[str, Any]) -> None:
+        amount = message.get("amount")
+        amount_str = f" {amount}" if amount is not None else ""
+        log["actions"].setdefault(state["phase_label"], []).append(f"{seat_label(message.get('seat'))} {_VERBS[message['ev']]}{amount_str}")
+
+    # Each decoded message is fresh and never reused, so its lists can be kept as-is. Boards are
+    # never mutated: a new card makes a new list, so each street's snapshot can share it.
+    def ev_flop(log: Dict[str, Any], message: Dict[str, Any]) -> None:
+        set_phase("FLOP")
+        log["board"] = log["board_by_phase"]["FLOP"] = message.get("cards") or []
+
+    def ev_turn(log: Dict[str, Any], message: Dict[str, Any]) -> None:
+        card = message.get("card")
+        if card:
+            log["board"] = [*log["board"], card]
+        set_phase("TURN")
+        log["board_by_phase"]["TURN"] = log["board"]
+
+    def ev_river(log: Dict[str, Any], message: Dict[str, Any]) -> None:
+        card = message.get("card")
+        if card:
+            log["board"] = [*log["board"], card]
+        set_phase("RIVER")
+        log["board_by_phase"]["RIVER"] = log["board"]
+
+    def ev_showdown(log: Dict[str, Any], message: Dict[str, Any]) -> None:
+        set_phase("SHOWDOWN")
+        log["showdown"].append(
+            {
+                "seat": message.get("seat"),
+                "hand": message.get("hand") or [],
+                "rank": message.get("rank"),
             }
-            state["hand_log"] = log
-            LOGGER.info(
-                "[hand %s] start | button %s | stacks %s",
-                state["hand_id"],
-                seat_label(log["button"]),
-                format_stacks(log["start_stacks"]),
-            )
-            continue
-
-        if msg_type == "lobby":
-            # Keep track of player names when the host sends lobby updates.
-            players = message.get("players", [])
-            for player in players:
-                register_seat(state, player.get("seat"), player.get("team"))
-            continue
-
-        if msg_type == "event":
-            # Record table events to replay later in the summary.
-            log = state.get("hand_log")
-            if log is None:
-                continue
-            ev = message.get("ev")
-            if ev == "POST_BLINDS":
-                log["actions"]["PRE"].append(f"{seat_label(message.get('sb_seat'))} posts SB {message.get('sb')}")
-                log["actions"]["PRE"].append(f"{seat_label(message.get('bb_seat'))} posts BB {message.get('bb')}")
-            elif ev in {"BET", "CALL", "CHECK", "FOLD"}:
-                verbs = {
-                    "BET": "bets",
-                    "CALL": "calls",
-                    "CHECK": "checks",
-                    "FOLD": "folds",
-                }
-                amount = message.get("amount")
-                amount_str = f" {amount}" if amount is not None else ""
-                phase_key = state.get("phase_label", "PRE")
-                log["actions"].setdefault(phase_key, [])
-                log["actions"][phase_key].append(f"{seat_label(message.get('seat'))} {verbs[ev]}{amount_str}")
-            elif ev == "FLOP":
-                set_phase("FLOP")
-                log["board"] = list(message.get("cards", []))
-                log["board_by_phase"]["FLOP"] = list(log["board"])
-            elif ev == "TURN":
-                card = message.get("card")
-                if card:
-                    log["board"].append(card)
-                set_phase("TURN")
-                log["board_by_phase"]["TURN"] = list(log["board"])
-            elif ev == "RIVER":
-                card = message.get("card")
-                if card:
-                    log["board"].append(card)
-                set_phase("RIVER")
-                log["board_by_phase"]["RIVER"] = list(log["board"])
-            elif ev == "SHOWDOWN":
-                set_phase("SHOWDOWN")
-                log["showdown"].append(
-                    {
-                        "seat": message.get("seat"),
-                        "hand": list(message.get("hand", [])),
-                        "rank": message.get("rank"),
-                    }
-                )
-            elif ev == "POT_AWARD":
-                log["payouts"].append(
-                    {
-                        "seat": message.get("seat"),
-                        "amount": message.get("amount"),
-                    }
-                )
-            elif ev == "ELIMINATED":
-                seat = message.get("seat")
-                if seat is not None:
-                    log["eliminations"].append(seat)
-            else:
-                LOGGER.debug("Unhandled event %s for hand %s", ev, state.get("hand_id"))
-            continue
+        )
 
-        if msg_type == "act":
-            # Host is asking us to act; choose a move and respond.
-            set_phase(message.get("phase"))
-            you = message.get("you", {})
-            table = message.get("table", {})
-            ctx = ActionContext(
-                # Hand identification
-                hand_id=message["hand_id"],
-                seat=message["seat"],
-                phase=message.get("phase", "PRE_FLOP"),
-                # Your cards and stack
-                hole_cards=list(you.get("hole", [])),
-                stack=you.get("stack", 0),
-                committed=you.get("committed", 0),
-                to_call=you.get("to_call", 0),
-                # Table state
-                pot=message.get("pot", 0),
-                current_bet=message.get("current_bet", 0),
-                community=list(message.get("community", [])),
-                # Table configuration
-                button=table.get("button", 0),
-                sb=table.get("sb", 0),
-                bb=table.get("bb", 0),
-                seats=table.get("seats", 0),
-                # Opponent information
-                players=list(message.get("players", [])),
-                # Action constraints
-                legal=list(message.get("legal", [])),
-                call_amount=message.get("call_amount"),
-                min_raise_to=message.get("min_raise_to"),
-                max_raise_to=message.get("max_raise_to"),
-                min_raise_increment=message.get("min_raise_increment", 0),
-                # Time remaining
-                time_ms=you.get("time_ms", 0),
-            )
-            action, amount = choose_action(ctx)
-            action, amount = sanitize_action(action, amount, ctx)
-            payload: Dict[str, Any] = {
-                "type": "action",
-                "v": 1,
-                "hand_id": ctx.hand_id,
-                "action": action,
+    def ev_pot_award(log: Dict[str, Any], message: Dict[str, Any]) -> None:
+        log["payouts"].append(
+            {
+                "seat": message.get("seat"),
+                "amount": message.get("amount"),
             }
-            if amount is not None:
-                payload["amount"] = int(amount)
-            LOGGER.debug("Sending action: %s", payload)
-            await websocket.send(json.dumps(payload))
-            continue
+        )
 
-        if msg_type == "end_hand":
-            # Emit a human-readable recap now that the hand is complete.
-            log = state.get("hand_log")
-            final_stacks = format_stacks(message.get("stacks", []))
-            hand_id = message.get("hand_id") or state.get("hand_id")
-            if log:
-                LOGGER.info(
-                    "[hand %s] summary | button %s | start stacks %s",
-                    log["hand_id"],
-                    seat_label(log["button"]),
-                    format_stacks(log["start_stacks"]),
-                )
-                phase_order = [
-                    ("PRE", "Preflop"),
-                    ("FLOP", "Flop"),
-                    ("TURN", "Turn"),
-                    ("RIVER", "River"),
-                ]
-                actions = log.get("actions", {})
-                board_by_phase = log.get("board_by_phase", {})
-                for key, label in phase_order:
-                    entries = actions.get(key, [])
-                    board_cards = None if key == "PRE" else board_by_phase.get(key)
-                    if not entries and not board_cards:
-                        continue
-                    if key == "PRE":
-                        LOGGER.info("  %s:", label)
-                    else:
-                        board_str = render_cards(board_cards) if board_cards else "--"
-                        LOGGER.info("  %s [%s]:", label, board_str)
-                    for entry in entries:
-                        LOGGER.info("    %s", entry)
-                if log["showdown"]:
-                    LOGGER.info("  Showdown:")
-                    for entry in log["showdown"]:
-                        LOGGER.info(
-                            "    %s shows %s (%s)",
-                            seat_label(entry["seat"]),
-                            render_cards(entry["hand"]),
-                            entry.get("rank"),
-                        )
-                if log["payouts"]:
-                    LOGGER.info("  Payouts:")
-                    for entry in log["payouts"]:
-                        LOGGER.info("    %s +%s", seat_label(entry["seat"]), entry["amount"])
-                if log["eliminations"]:
-                    eliminated = ", ".join(seat_label(seat) for seat in log["eliminations"])
-                    LOGGER.info("  Eliminated: %s", eliminated)
-                state["hand_counter"] = state.get("hand_counter", 0) + 1
-            LOGGER.info("[hand %s] end | stacks %s", hand_id, final_stacks)
-            LOGGER.info("")
-            state["hand_log"] = None
-            continue
+    def ev_eliminated(log: Dict[str, Any], message: Dict[str, Any]) -> None:
+        seat = message.get("seat")
+        if seat is not None:
+            log["eliminations"].append(seat)
+
+    event_handlers: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], None]] = {
+        "POST_BLINDS": ev_post_blinds,
+        "BET": ev_action,
+        "CALL": ev_action,
+        "CHECK": ev_action,
+        "FOLD": ev_action,
+        "FLOP": ev_flop,
+        "TURN": ev_turn,
+        "RIVER": ev_river,
+        "SHOWDOWN": ev_showdown,
+        "POT_AWARD": ev_pot_award,
+        "ELIMINATED": ev_eliminated,
+    }
 
-        if msg_type == "match_end":
-            final_stacks = message.get("final_stacks", [])
-            for entry in final_stacks:
-                register_seat(state, entry.get("seat"), entry.get("team"))
-            winner = message.get("winner") or {}
-            winner_label = (
-                f"{seat_label(winner.get('seat'))}"
-                if winner
-                else "None"
-            )
+    async def on_event(message: Dict[str, Any]) -> bool:
+        log = state.get("hand_log")
+        if log is None:
+            return False
+        ev = message.get("ev")
+        handler = event_handlers.get(ev)
+        if handler is None:
+            LOGGER.debug("Unhandled event %s for hand %s", ev, state.get("hand_id"))
+        else:
+            handler(log, message)
+        return False
+
+    async def on_act(message: Dict[str, Any]) -> bool:
+        # Host is asking us to act; choose a move and respond.
+        set_phase(message.get("phase"))
+        you = message.get("you", {})
+        table = message.get("table", {})
+        # The decoded message is discarded after this prompt, so its lists are handed over as-is.
+        ctx = ActionContext(
+            # Hand identification
+            hand_id=message["hand_id"],
+            seat=message["seat"],
+            phase=message.get("phase", "PRE_FLOP"),
+            # Your cards and stack
+            hole_cards=you.get("hole", []),
+            stack=you.get("stack", 0),
+            committed=you.get("committed", 0),
+            to_call=you.get("to_call", 0),
+            # Table state
+            pot=message.get("pot", 0),
+            current_bet=message.get("current_bet", 0),
+            community=message.get("community", []),
+            # Table configuration
+            button=table.get("button", 0),
+            sb=table.get("sb", 0),
+            bb=table.get("bb", 0),
+            seats=table.get("seats", 0),
+            # Opponent information
+            players=message.get("players", []),
+            # Action constraints
+            legal=message.get("legal", []),
+            call_amount=message.get("call_amount"),
+            min_raise_to=message.get("min_raise_to"),
+            max_raise_to=message.get("max_raise_to"),
+            min_raise_increment=message.get("min_raise_increment", 0),
+            # Time remaining
+            time_ms=you.get("time_ms", 0),
+        )
+        action, amount = choose_action(ctx)
+        action, amount = sanitize_action(action, amount, ctx)
+        if amount is not None:
+            amount = int(amount)
+        if debug_on:
+            LOGGER.debug("Sending action: %s amount=%s hand=%s", action, amount, ctx.hand_id)
+        if template_frames:
+            await websocket.send(action_frame(ctx.hand_id, action, amount))
+            return False
+        payload: Dict[str, Any] = {
+            "type": "action",
+            "v": 1,
+            "hand_id": ctx.hand_id,
+            "action": action,
+        }
+        if amount is not None:
+            payload["amount"] = amount
+        await websocket.send(encode(payload))
+        return False
+
+    async def on_end_hand(message: Dict[str, Any]) -> bool:
+        # Emit a human-readable recap now that the hand is complete.
+        if not info_on:
+            state["hand_counter"] += 1
+            return False
+        log = state.get("hand_log")
+        final_stacks = format_stacks(message.get("stacks", []))
+        hand_id = message.get("hand_id") or state.get("hand_id")
+        if log:
             LOGGER.info(
-                "[match] winner=%s final_stacks=%s",
-                winner_label,
-                format_stacks(message.get("final_stacks", [])),
+                "[hand %s] summary | button %s | start stacks %s",
+                log["hand_id"],
+                seat_label(log["button"]),
+                format_stacks(log["start_stacks"]),
             )
-            LOGGER.info("")
-            break
-
-        if msg_type == "error":
-            LOGGER.warning("[error] %s", message)
-            continue
+            phase_order = [
+                ("PRE", "Preflop"),
+                ("FLOP", "Flop"),
+                ("TURN", "Turn"),
+                ("RIVER", "River"),
+            ]
+            actions = log.get("actions", {})
+            board_by_phase = log.get("board_by_phase", {})
+            for key, label in phase_order:
+                entries = actions.get(key, [])
+                board_cards = None if key == "PRE" else board_by_phase.get(key)
+                if not entries and not board_cards:
+                    continue
+                if key == "PRE":
+                    LOGGER.info("  %s:", label)
+                else:
+                    board_str = render_cards(board_cards) if board_cards else "--"
+                    LOGGER.info("  %s [%s]:", label, board_str)
+                for entry in entries:
+                    LOGGER.info("    %s", entry)
+            if log["showdown"]:
+                LOGGER.info("  Showdown:")
+                for entry in log["showdown"]:
+                    LOGGER.info(
+                        "    %s shows %s (%s)",
+                        seat_label(entry["seat"]),
+                        render_cards(entry["hand"]),
+                        entry.get("rank"),
+                    )
+            if log["payouts"]:
+                LOGGER.info("  Payouts:")
+                for entry in log["payouts"]:
+                    LOGGER.info("    %s +%s", seat_label(entry["seat"]), entry["amount"])
+            if log["eliminations"]:
+                eliminated = ", ".join(seat_label(seat) for seat in log["eliminations"])
+                LOGGER.info("  Eliminated: %s", eliminated)
+            state["hand_counter"] = state.get("hand_counter", 0) + 1
+        LOGGER.info("[hand %s] end | stacks %s", hand_id, final_stacks)
+        LOGGER.info("")
+        state["hand_log"] = None
+        return False
+
+    async def on_match_end(message: Dict[str, Any]) -> bool:
+        final_stacks = message.get("final_stacks", [])
+        for entry in final_stacks:
+            register_seat(state, entry.get("seat"), entry.get("team"))
+        if not info_on:
+            return True
+        winner = message.get("winner") or {}
+        winner_label = (
+            f"{seat_label(winner.get('seat'))}"
+            if winner
+            else "None"
+        )
+        LOGGER.info(
+            "[match] winner=%s final_stacks=%s",
+            winner_label,
+            format_stacks(message.get("final_stacks", [])),
+        )
+        LOGGER.info("")
+        return True
+
+    async def on_error(message: Dict[str, Any]) -> bool:
+        LOGGER.warning("[error] %s", message)
+        return False
+
+    async def on_snapshot(message: Dict[str, Any]) -> bool:
+        LOGGER.debug("[snapshot] %s", message)
+        return False
+
+    # A dict lookup finds the handler in one step instead of walking an if/elif chain.
+    handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[bool]]] = {
+        "welcome": on_welcome,
+        "ab_status": on_ab_status,
+        "start_hand": on_start_hand,
+        "lobby": on_lobby,
+        "event": on_event,
+        "act": on_act,
+        "end_hand": on_end_hand,
+        "match_end": on_match_end,
+        "error": on_error,
+        "snapshot": on_snapshot,
+    }
 
-        if msg_type == "snapshot":
-            LOGGER.debug("[snapshot] %s", message)
+    async for message in iter_messages(websocket):
+        msg_type = message.get("type")
+        handler = handlers.get(msg_type)
+        if handler is None:
+            LOGGER.debug("Ignoring message type=%s", msg_type)
             continue
+        if await handler(message):
+            break
 
-        LOGGER.debug("Ignoring message type=%s", msg_type)
-
-
-async def run_bot(team: str, url: str, bot: Optional[str] = None) -> None:
+async def run_bot(team: str, url: str, bot: Optional[str] = None, use_msgpack: bool = False) -> None:
+    subprotocols = ["msgpack"] if use_msgpack else None
     try:
-        async with websockets.connect(url) as ws:
+        # Host frames are small and frequent: deflate costs more CPU than it saves, and the bot
+        # drains every frame in order, so the receive queue needs no cap.
+        async with websockets.connect(url, subprotocols=subprotocols, compression=None, max_queue=None) as ws:
             hello = {
                 "type": "hello",
                 "v": 1,
@@ -499,7 +653,9 @@ async def run_bot(team: str, url: str, bot: Optional[str] = None) -> None:
             }
             if bot:
                 hello["bot"] = bot
-            await ws.send(json.dumps(hello))
+            # Practice hosts may then group several events into one "events" frame.
+            hello["batch_events"] = True
+            await ws.send(encoder_for(ws)(hello))
             label = f"{team} ({bot})" if bot else team
             LOGGER.info("[connect] %s as %s", url, label)
             # Stay inside play_hand until the server sends match_end.
@@ -529,13 +685,22 @@ def parse_args() -> argparse.Namespace:
         type=_bot,
         help="Optional practice slot (A or B) to enable in-server A/B testing",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--msgpack",
+        action="store_true",
+        help="Ask the practice host for binary MessagePack frames (needs the msgpack package)",
+    )
+    args = parser.parse_args()
+    if args.msgpack and msgpack is None:
+        parser.error("--msgpack requires the msgpack package (pip install msgpack)")
+    return args
 
 
 def main() -> None:
     args = parse_args()
     LOGGER.setLevel(getattr(logging, args.log_level.upper(), logging.INFO))
-    asyncio.run(run_bot(args.team, args.url, bot=args.bot))
+    runner = uvloop.run if uvloop is not None else asyncio.run
+    runner(run_bot(args.team, args.url, bot=args.bot, use_msgpack=args.msgpack))
 
 
 # ---------------------------------------------------------------------------
@@ -543,19 +708,39 @@ def main() -> None:
 # ---------------------------------------------------------------------------
 
 
+async def iter_messages(websocket: websockets.WebSocketServerProtocol) -> AsyncIterator[Dict[str, Any]]:
+    """Yield decoded host messages, unpacking batched "events" frames into single events."""
+
+    use_msgpack = websocket.subprotocol == "msgpack"
+    async for raw in websocket:
+        # Only a msgpack connection carries MessagePack, and even there the hello errors are JSON
+        # text frames. Anything else is JSON, whether it arrives as text or binary.
+        if use_msgpack and not isinstance(raw, str):
+            message = msgpack.unpackb(raw, raw=False)
+        else:
+            message = _loads(raw)
+        if message.get("type") == "events":
+            for item in message.get("items", []):
+                yield item
+        else:
+            yield message
+
+
 def register_seat(state: Dict[str, Any], seat: Optional[int], team: Optional[str]) -> None:
     """Remember which team is sitting in each seat so logs can use names."""
 
     if seat is None or team is None:
         return
     state.setdefault("seat_map", {})[seat] = team
+    # Labels formatted before this may now name the wrong team.
+    state.get("seat_labels", {}).clear()
 
 
 def render_card(card: str) -> str:
     """Return a card such as 'Ah' rendered with a unicode suit if enabled."""
 
-    if USE_UNICODE_CARDS and len(card) == 2 and card[1] in SUIT_SYMBOLS:
-        return card[0] + SUIT_SYMBOLS[card[1]]
+    if USE_UNICODE_CARDS:
+        return RENDER_CACHE.get(card, card)
     return card
 
 
@@ -564,7 +749,13 @@ def render_cards(cards: list[str]) -> str:
 
     if not cards:
         return "--"
-    return " ".join(render_card(card) for card in cards)
+    if USE_UNICODE_CARDS:
+        try:
+            # Straight table lookups, no Python-level call per card.
+            return " ".join(map(RENDER_CACHE.__getitem__, cards))
+        except KeyError:
+            pass  # an unexpected card string; render_card leaves it as-is
+    return " ".join(map(render_card, cards))
 
 
 if __name__ == "__main__":
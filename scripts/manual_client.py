@@ -9,13 +9,17 @@ import sys
 import time
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import websockets
 from websockets import WebSocketClientProtocol
 
 logging.basicConfig(level=logging.INFO)
 
+# Runs straight from a checkout, so it keeps its own copy of core.runtime's encoder.
+_JSON_ENCODE = json.JSONEncoder(separators=(",", ":"), check_circular=False, ensure_ascii=False).encode
+_JSON_DECODE = json.JSONDecoder().decode
+
 # ManualClient mirrors what a bot does but with terminal prompts.
 
 
@@ -58,6 +62,18 @@ class ManualClient:
         self.seat: Optional[int] = None
         self.hand_state: Optional[HandState] = None
         self.recent_events: deque[str] = deque(maxlen=6)
+        # Message type -> printer; one dict lookup per message instead of an if/elif chain.
+        self._printers: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            "welcome": self._print_welcome,
+            "lobby": self._print_lobby,
+            "start_hand": self._print_start_hand,
+            "act": self._print_act,
+            "event": self._print_event,
+            "snapshot": self._print_snapshot,
+            "end_hand": self._print_end_hand,
+            "error": self._print_error,
+            "match_end": self._print_match_end,
+        }
 
     async def run(self) -> None:
         async with websockets.connect(self.url) as ws:
@@ -75,7 +91,7 @@ class ManualClient:
         assert self.websocket is not None
         while True:
             raw = await self.websocket.recv()
-            msg = json.loads(raw)
+            msg = _JSON_DECODE(raw)
             msg_type = msg.get("type")
             self._print_message(msg)
 
@@ -172,44 +188,56 @@ class ManualClient:
         msg_type = msg.get("type")
         header = f"\n>>> {msg_type.upper()}"
         print(header)
-        if msg_type == "welcome":
-            print(f"Seat: {msg['seat']}, config: {json.dumps(msg['config'])}")
-            self.seat = msg.get("seat")
-        elif msg_type == "lobby":
-            players = ", ".join(
-                f"{p['seat']}:{p['team']} ({'✓' if p['connected'] else '×'})"
-                for p in msg.get("players", [])
-            )
-            print(f"Lobby: {players}")
-        elif msg_type == "start_hand":
-            self._start_hand_state(msg)
-            print(f"Hand {msg['hand_id']} seed={msg['seed']} button={msg['button']}")
-            stacks = msg.get("stacks", [])
-            if stacks:
-                seated = ", ".join(f"{entry['seat']}:{entry['stack']}" for entry in stacks)
-                print(f"Starting stacks: {seated}")
-        elif msg_type == "act":
-            self._sync_state_from_act(msg)
-            self._render_act_view(msg)
-        elif msg_type == "event":
-            self._apply_event(msg)
-            ev = msg.get("ev")
-            summary = {k: v for k, v in msg.items() if k not in {"type", "v", "ts", "ev"}}
-            print(f"Event {ev}: {summary}")
-        elif msg_type == "snapshot":
-            print(
-                f"Snapshot hand={msg['at_hand_id']} phase={msg['phase']} next_actor={msg['next_actor']}"
-            )
-        elif msg_type == "end_hand":
-            print(f"Stacks: {msg.get('stacks')}")
-            self.hand_state = None
-        elif msg_type == "error":
-            print(f"Error {msg.get('code')}: {msg.get('msg')}")
-        elif msg_type == "match_end":
-            print(f"Winner: {msg.get('winner')} | stacks: {msg.get('final_stacks')}")
-            self.hand_state = None
-        else:
+        printer = self._printers.get(msg_type)
+        if printer is None:
             print(json.dumps(msg, indent=2))
+        else:
+            printer(msg)
+
+    def _print_welcome(self, msg: Dict[str, Any]) -> None:
+        print(f"Seat: {msg['seat']}, config: {json.dumps(msg['config'])}")
+        self.seat = msg.get("seat")
+
+    def _print_lobby(self, msg: Dict[str, Any]) -> None:
+        players = ", ".join(
+            f"{p['seat']}:{p['team']} ({'✓' if p['connected'] else '×'})"
+            for p in msg.get("players", [])
+        )
+        print(f"Lobby: {players}")
+
+    def _print_start_hand(self, msg: Dict[str, Any]) -> None:
+        self._start_hand_state(msg)
+        print(f"Hand {msg['hand_id']} seed={msg['seed']} button={msg['button']}")
+        stacks = msg.get("stacks", [])
+        if stacks:
+            seated = ", ".join(f"{entry['seat']}:{entry['stack']}" for entry in stacks)
+            print(f"Starting stacks: {seated}")
+
+    def _print_act(self, msg: Dict[str, Any]) -> None:
+        self._sync_state_from_act(msg)
+        self._render_act_view(msg)
+
+    def _print_event(self, msg: Dict[str, Any]) -> None:
+        self._apply_event(msg)
+        ev = msg.get("ev")
+        summary = {k: v for k, v in msg.items() if k not in {"type", "v", "ts", "ev"}}
+        print(f"Event {ev}: {summary}")
+
+    def _print_snapshot(self, msg: Dict[str, Any]) -> None:
+        print(
+            f"Snapshot hand={msg['at_hand_id']} phase={msg['phase']} next_actor={msg['next_actor']}"
+        )
+
+    def _print_end_hand(self, msg: Dict[str, Any]) -> None:
+        print(f"Stacks: {msg.get('stacks')}")
+        self.hand_state = None
+
+    def _print_error(self, msg: Dict[str, Any]) -> None:
+        print(f"Error {msg.get('code')}: {msg.get('msg')}")
+
+    def _print_match_end(self, msg: Dict[str, Any]) -> None:
+        print(f"Winner: {msg.get('winner')} | stacks: {msg.get('final_stacks')}")
+        self.hand_state = None
 
     def _start_hand_state(self, msg: Dict[str, Any]) -> None:
         stacks = msg.get("stacks", [])
@@ -437,7 +465,7 @@ class ManualClient:
 
     async def _send(self, payload: Dict[str, Any]) -> None:
         assert self.websocket is not None
-        await self.websocket.send(json.dumps(payload))
+        await self.websocket.send(_JSON_ENCODE(payload))
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -23,8 +23,22 @@ from typing import Any, Dict, Optional
 import websockets
 
 from core.models import ActionType, TableConfig
+from core.runtime import json_encode, run_event_loop
 from tournament.server import HostServer
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; the stdlib json module works the same way here
+    orjson = None
+
+if orjson is not None:
+    # orjson's bytes go out as binary frames, which the host parses without a str round-trip.
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    _dumps = json_encode
+    _loads = json.JSONDecoder().decode
+
 LOGGER = logging.getLogger("tourney_sim")
 
 
@@ -37,9 +51,11 @@ class BotProfile:
 def choose_action(message: Dict[str, Any], rng: random.Random) -> tuple[str, Optional[int]]:
     """Pick a random (but legal) action with lightweight heuristics."""
 
-    legal = list(message.get("legal", []))
+    # The list keeps the host's order for rng.choice; the set answers membership tests.
+    legal = message.get("legal") or []
     if not legal:
         return "FOLD", None
+    allowed = frozenset(legal)
 
     call_amount = message.get("call_amount") or 0
     min_raise = message.get("min_raise_to")
@@ -51,7 +67,7 @@ def choose_action(message: Dict[str, Any], rng: random.Random) -> tuple[str, Opt
     phase = message.get("phase")
 
     # Prefer checking preflop with junk, otherwise choose randomly.
-    if "CHECK" in legal and phase == "PRE_FLOP" and call_amount == 0:
+    if "CHECK" in allowed and phase == "PRE_FLOP" and call_amount == 0:
         hole = message.get("you", {}).get("hole", [])
         ranks = {card[0] for card in hole}
         if not ranks.intersection({"A", "K", "Q", "J"}) and rng.random() < 0.7:
@@ -63,11 +79,11 @@ def choose_action(message: Dict[str, Any], rng: random.Random) -> tuple[str, Opt
         available = stack + call_amount
         min_total = call_amount + committed
         if not min_raise or available < min_raise or available <= min_total:
-            return ("CALL" if "CALL" in legal else "FOLD"), None
+            return ("CALL" if "CALL" in allowed else "FOLD"), None
         upper = min(max_raise or available, available)
         lower = max(min_raise, min_total)
         if lower > upper:
-            return ("CALL" if "CALL" in legal else "FOLD"), None
+            return ("CALL" if "CALL" in allowed else "FOLD"), None
         target = upper if rng.random() < 0.25 else rng.randint(lower, upper)
         return "RAISE_TO", target
 
@@ -81,9 +97,10 @@ def choose_action(message: Dict[str, Any], rng: random.Random) -> tuple[str, Opt
 
 
 def safe_action(message: Dict[str, Any]) -> tuple[str, Optional[int]]:
-    if "CHECK" in message.get("legal", []):
+    allowed = frozenset(message.get("legal", ()))
+    if "CHECK" in allowed:
         return "CHECK", None
-    if "CALL" in message.get("legal", []):
+    if "CALL" in allowed:
         return "CALL", None
     return "FOLD", None
 
@@ -98,57 +115,74 @@ async def run_bot(profile: BotProfile, url: str, stop_event: asyncio.Event) -> N
                 "v": 1,
                 "team": profile.name,
             }
-            await ws.send(json.dumps(hello))
-
+            await ws.send(_dumps(hello))
+
+            # Closing the socket once the match is over ends the receive loop below, so the bot
+            # never has to wake up on a timer just to check stop_event.
+            async def close_on_stop() -> None:
+                await stop_event.wait()
+                await ws.close()
+
+            # Replies go through a queue drained by their own task, so a slow socket write never
+            # holds up reading the next host message.
+            outbox: asyncio.Queue[str | bytes] = asyncio.Queue()
+
+            async def send_queued() -> None:
+                # A closed socket also ends the receive loop, which handles the shutdown.
+                with contextlib.suppress(websockets.ConnectionClosed):
+                    while True:
+                        await ws.send(await outbox.get())
+
+            closer = asyncio.create_task(close_on_stop())
+            sender = asyncio.create_task(send_queued())
             pending_ctx: Optional[Dict[str, Any]] = None
-            while not stop_event.is_set():
-                try:
-                    raw = await asyncio.wait_for(ws.recv(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    continue
-                except websockets.ConnectionClosed:
-                    break
-
-                message = json.loads(raw)
-                msg_type = message.get("type")
-
-                if msg_type == "act":
-                    action, amount = choose_action(message, profile.rng)
-                    if action == "RAISE_TO" and amount is not None and amount < message.get("min_raise_to", 0):
-                        action, amount = safe_action(message)
-                    payload = {
-                        "type": "action",
-                        "v": 1,
-                        "hand_id": message["hand_id"],
-                        "action": action,
-                    }
-                    if amount is not None:
-                        payload["amount"] = int(amount)
-                    await ws.send(json.dumps(payload))
-                    pending_ctx = message
-
-                elif msg_type == "match_end":
-                    LOGGER.info("%s received match_end", profile.name)
-                    stop_event.set()
-                    break
-
-                elif msg_type == "error" and pending_ctx:
-                    LOGGER.warning(
-                        "%s received error %s; sending safe fallback",
-                        profile.name,
-                        message,
-                    )
-                    fallback_action, fallback_amount = safe_action(pending_ctx)
-                    payload = {
-                        "type": "action",
-                        "v": 1,
-                        "hand_id": pending_ctx["hand_id"],
-                        "action": fallback_action,
-                    }
-                    if fallback_amount is not None:
-                        payload["amount"] = fallback_amount
-                    await ws.send(json.dumps(payload))
-                    pending_ctx = None
+            try:
+                async for raw in ws:
+                    message = _loads(raw)
+                    msg_type = message.get("type")
+
+                    if msg_type == "act":
+                        action, amount = choose_action(message, profile.rng)
+                        if action == "RAISE_TO" and amount is not None and amount < message.get("min_raise_to", 0):
+                            action, amount = safe_action(message)
+                        payload = {
+                            "type": "action",
+                            "v": 1,
+                            "hand_id": message["hand_id"],
+                            "action": action,
+                        }
+                        if amount is not None:
+                            payload["amount"] = int(amount)
+                        outbox.put_nowait(_dumps(payload))
+                        pending_ctx = message
+
+                    elif msg_type == "match_end":
+                        LOGGER.info("%s received match_end", profile.name)
+                        stop_event.set()
+                        break
+
+                    elif msg_type == "error" and pending_ctx:
+                        LOGGER.warning(
+                            "%s received error %s; sending safe fallback",
+                            profile.name,
+                            message,
+                        )
+                        fallback_action, fallback_amount = safe_action(pending_ctx)
+                        payload = {
+                            "type": "action",
+                            "v": 1,
+                            "hand_id": pending_ctx["hand_id"],
+                            "action": fallback_action,
+                        }
+                        if fallback_amount is not None:
+                            payload["amount"] = fallback_amount
+                        outbox.put_nowait(_dumps(payload))
+                        pending_ctx = None
+            except websockets.ConnectionClosed:
+                pass
+            finally:
+                closer.cancel()
+                sender.cancel()
 
     except Exception as exc:  # noqa: BLE001
         LOGGER.exception("Bot %s crashed: %s", profile.name, exc)
@@ -232,7 +266,7 @@ def main() -> None:
     args = parse_args()
     logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO))
     try:
-        asyncio.run(run_simulation(args))
+        run_event_loop(run_simulation(args))
     except KeyboardInterrupt:
         LOGGER.info("Simulation interrupted; shutting down")
 
@@ -1,4 +1,4 @@
-from core.models import ActionType
+from core.models import ActionType, Phase
 
 from .helpers import create_engine, start_hand
 
@@ -48,10 +48,10 @@ def test_multiway_all_ins_create_side_pots_and_awards():
     assert ActionType.CALL in legal
     aggregated_events.extend(engine.apply_action(third_actor, ActionType.CALL, None))
 
-    # Confirm side-pot structure before community cards run out.
-    pots = engine._build_side_pots()
-    assert len(pots) == 2
-    assert pots[0][0] > 0 and pots[1][0] > 0
+    # Only one seat still has chips, so the call runs the board out and pays a main and a side pot.
+    assert engine.hand.phase == Phase.SHOWDOWN
+    assert [event["ev"] for event in aggregated_events].count("RIVER") == 1
+    assert len([event for event in aggregated_events if event["ev"] == "POT_AWARD"]) >= 2
 
     # Finish the hand with straightforward actions.
     while not engine.is_hand_complete():
@@ -1,6 +1,6 @@
 import pytest
 
-from core.cards import Card, deal
+from core.cards import Deck, card_int, deal
 from core.models import ActionType
 
 from .helpers import create_engine, start_hand
@@ -46,7 +46,7 @@ def test_apply_action_rejects_unknown_action():
 
 
 def test_deal_raises_when_deck_exhausted():
-    deck = [Card("A", "h"), Card("K", "d")]
+    deck = Deck([card_int("A", "h"), card_int("K", "d")])
     deal(deck, 2)
     with pytest.raises(ValueError, match="Not enough cards"):
         deal(deck, 1)
@@ -1,7 +1,19 @@
+import random
+
 import pytest
 
-from core.cards import Card, build_deck
-from core.evaluator import evaluate_best, parse_cards
+from core.cards import BASE_DECK, build_deck, card_int, card_label, deal, shuffle_into
+from core.evaluator import (
+    decode_strength,
+    evaluate_board_batch,
+    evaluate_best,
+    evaluate_best_batch,
+    evaluate_cached,
+    hand_category,
+    parse_cards,
+    straight_high,
+)
+from core.simulate import simulate_many
 
 
 def test_evaluate_best_identifies_all_hand_categories():
@@ -19,15 +31,16 @@ def test_evaluate_best_identifies_all_hand_categories():
 
     for expected_rank, labels in cases:
         cards = parse_cards(labels)
-        rank, _ = evaluate_best(cards)
-        assert rank == expected_rank, f"labels={labels}"
+        assert hand_category(evaluate_best(cards)) == expected_rank, f"labels={labels}"
 
 
 def test_evaluate_best_handles_wheel_straight():
     cards = parse_cards(["Ah", "2d", "3c", "4s", "5h", "9d", "Kd"])
-    rank, detail = evaluate_best(cards)
-    assert rank == 4
-    assert detail[0] == 5
+    wheel = evaluate_best(cards)
+    assert hand_category(wheel) == 4
+    assert decode_strength(wheel) == (4, [5])
+    six_high = evaluate_best(parse_cards(["2d", "3c", "4s", "5h", "6h"]))
+    assert wheel < six_high
 
 
 def test_evaluate_best_compares_kickers_for_equal_pairs():
@@ -36,17 +49,76 @@ def test_evaluate_best_compares_kickers_for_equal_pairs():
     assert evaluate_best(hand_a) > evaluate_best(hand_b)
 
 
+def test_decode_strength_returns_category_and_kickers():
+    two_pair = evaluate_best(parse_cards(["7h", "7d", "4s", "4c", "As", "2d", "3c"]))
+    assert decode_strength(two_pair) == (2, [7, 4, 14])
+
+
 def test_card_validation_rejects_invalid_labels():
     with pytest.raises(ValueError, match="Invalid rank"):
-        Card("1", "h")
+        card_int("1", "h")
     with pytest.raises(ValueError, match="Invalid suit"):
-        Card("A", "x")
+        card_int("A", "x")
 
 
 def test_parse_cards_and_evaluate_supports_multiple_seven_card_hands():
     deck = build_deck(seed=777)
-    for idx in range(0, 42, 7):
-        seven_card_hand = deck[idx : idx + 7]
-        rank, detail = evaluate_best(seven_card_hand)
-        assert 0 <= rank <= 8
-        assert isinstance(detail, list)
+    for _ in range(6):
+        seven_card_hand = deal(deck, 7)
+        strength = evaluate_best(seven_card_hand)
+        assert 0 <= hand_category(strength) <= 8
+        assert isinstance(strength, int)
+
+
+def test_card_int_packs_cactus_kev_layout():
+    ace_spades = card_int("A", "s")
+    assert ace_spades & 0xFF == 41  # ace prime
+    assert (ace_spades >> 8) & 0xF == 12
+    assert (ace_spades >> 12) & 0xF == 0x8
+    assert ace_spades >> 16 == 1 << 12
+    assert card_label(ace_spades) == "As"
+    assert parse_cards(["As"]) == [ace_spades]
+
+
+def test_straight_high_picks_best_straight_in_any_card_count():
+    assert straight_high(parse_cards(["Ah", "2d", "3c", "4s", "5h"])) == 5
+    assert straight_high(parse_cards(["Ah", "2d", "3c", "4s", "5h", "6d", "9c"])) == 6
+    assert straight_high(parse_cards(["Th", "Jd", "Qc", "Ks", "Ah"])) == 14
+    assert straight_high(parse_cards(["Ah", "Kd", "Qc", "Js", "9h", "2d"])) == 0
+
+
+def test_shuffle_into_reuses_buffer_and_matches_build_deck():
+    buf = [0] * len(BASE_DECK)
+    shuffle_into(buf, random.Random(42))
+    assert sorted(buf) == sorted(BASE_DECK)
+    assert buf == build_deck(seed=42).cards.tolist()
+
+
+def test_evaluate_best_batch_matches_single_evaluations():
+    deck = build_deck(seed=99)
+    hands = [deal(deck, 7) for _ in range(6)] + [parse_cards(["As", "Ks", "Qs", "Js", "Ts"])]
+    assert evaluate_best_batch(hands) == [evaluate_best(hand) for hand in hands]
+
+
+def test_evaluate_cached_ignores_card_order():
+    hand = parse_cards(["Ah", "Kd", "Kc", "7s", "7h", "2c", "9d"])
+    assert evaluate_cached(hand) == evaluate_best(hand)
+    assert evaluate_cached(list(reversed(hand))) == evaluate_best(hand)
+
+
+def test_evaluate_board_batch_matches_per_hand_evaluation():
+    deck = build_deck(seed=5)
+    board = deal(deck, 5)
+    holes = [deal(deck, 2) for _ in range(9)]
+    assert evaluate_board_batch(board, holes) == [evaluate_best(hole + board) for hole in holes]
+
+
+def test_simulate_many_is_reproducible_per_seed():
+    aces = parse_cards(["As", "Ah"])
+    rags = parse_cards(["7c", "2d"])
+    batch = simulate_many([aces, rags, aces], [1, 2, 3])
+    assert simulate_many([aces], [3]) == [batch[2]]
+    assert simulate_many([rags, aces], [2, 1]) == [batch[1], batch[0]]
+    assert hand_category(batch[0]) >= 1  # pocket aces never play worse than a pair
+    with pytest.raises(ValueError):
+        simulate_many([aces], [1, 2])
@@ -1,9 +1,11 @@
 import itertools
+import time
 
 import pytest
 
-from core.cards import Card, RANKS, SUITS
-from core.game import GameEngine
+import core.game as game_module
+from core.cards import RANKS, SUITS, Deck, card_int
+from core.game import CALL_BIT, FOLD_BIT, RAISE_TO_BIT, GameEngine
 from core.models import ActionType, TableConfig
 
 
@@ -52,6 +54,20 @@ def test_start_hand_assigns_button_and_blinds():
     ]
 
 
+def test_assign_seat_reuses_seat_for_same_team():
+    engine = GameEngine(TableConfig(seats=4, starting_stack=1000, sb=10, bb=20))
+    first = engine.assign_seat("Alpha")
+    engine.assign_seat("Beta")
+    again = engine.assign_seat("  ALPHA ")
+    assert again is first
+    assert again.team == "ALPHA"
+
+    engine.seats[first.seat] = None
+    replacement = engine.assign_seat("Alpha")
+    assert replacement is not first
+    assert engine.seats[replacement.seat] is replacement
+
+
 def test_heads_up_button_posts_small_blind_and_acts_first():
     engine = GameEngine(TableConfig(seats=2, starting_stack=1000, sb=10, bb=20))
     seat_btn = engine.assign_seat("Button")
@@ -78,6 +94,41 @@ def test_action_payload_has_flat_legal_fields():
     assert payload["min_raise_increment"] == engine.config.bb
 
 
+def test_players_view_cached_until_next_action():
+    engine, _ = setup_engine()
+    seat = engine.next_actor()
+    engine.act_payload(seat)
+    cached = engine.hand.players_view
+    first = engine.snapshot_payload(seat, 1000)["players"]
+    assert engine.hand.players_view is cached
+    assert first == cached and first is not cached
+
+    engine.apply_action(seat, ActionType.CALL, None)
+    refreshed = engine.snapshot_payload(seat, 1000)["players"]
+    assert engine.hand.players_view is not cached
+    assert next(p for p in refreshed if p["seat"] == seat)["committed"] == engine.config.bb
+
+
+def test_legal_actions_cached_until_state_changes():
+    engine, _ = setup_engine()
+    seat = engine.next_actor()
+    first = engine.legal_actions(seat)
+    assert engine.legal_actions(seat) is first
+
+    engine.apply_action(seat, ActionType.CALL, None)
+    assert engine.legal_actions(seat) is not first
+
+
+def test_legal_action_mask_matches_legal_actions():
+    engine, _ = setup_engine()
+    seat = engine.next_actor()
+    legal, call_amount, min_raise_to, max_raise_to = engine.legal_actions(seat)
+    mask, *numbers = engine.legal_action_mask(seat)
+    assert legal == [ActionType.FOLD, ActionType.CALL, ActionType.RAISE_TO]
+    assert mask == FOLD_BIT | CALL_BIT | RAISE_TO_BIT
+    assert numbers == [call_amount, min_raise_to, max_raise_to]
+
+
 def test_raise_updates_pot_and_pending_callers():
     engine, _ = setup_engine()
     actor = engine.next_actor()
@@ -86,6 +137,7 @@ def test_raise_updates_pot_and_pending_callers():
     assert any(ev["ev"] == "BET" for ev in events)
     assert engine.hand.current_bet == min_raise
     assert engine.hand.last_raise_seat == actor
+    assert engine.hand.pending_callers_mask == 0b1111 & ~(1 << actor)
 
 
 def test_showdown_awards_side_pot_and_flags_elimination():
@@ -146,7 +198,7 @@ def test_split_pot_results_in_equal_awards(monkeypatch):
     used = []
     def card(rank, suit):
         used.append((rank, suit))
-        return Card(rank, suit)
+        return card_int(rank, suit)
 
     custom_cards = [
         card("8", "c"), card("9", "d"),  # Seat order: BB first card, button second
@@ -158,9 +210,9 @@ def test_split_pot_results_in_equal_awards(monkeypatch):
     for rank in RANKS:
         for suit in SUITS:
             if (rank, suit) not in used:
-                custom_cards.append(Card(rank, suit))
+                custom_cards.append(card_int(rank, suit))
 
-    monkeypatch.setattr("core.game.build_deck", lambda seed=None: list(custom_cards))
+    monkeypatch.setattr("core.game.build_deck", lambda seed=None: Deck(list(custom_cards)))
 
     ctx = engine.start_hand()
     assert ctx is not None
@@ -240,8 +292,53 @@ def test_fold_immediately_ends_hand_without_extra_prompt():
     assert any(ev["ev"] == "FOLD" for ev in events)
     assert any(ev["ev"] == "POT_AWARD" for ev in events)
     assert engine.is_hand_complete()
-    assert not ctx.actor_queue
-    assert not ctx.pending_callers
+    assert engine.next_actor() is None
+    assert not ctx.pending_callers_mask
+
+
+def test_busted_seat_is_not_counted_in_hand():
+    engine = GameEngine(TableConfig(seats=3, starting_stack=500, sb=10, bb=20))
+    engine.assign_seat("A")
+    engine.assign_seat("B")
+    busted = engine.assign_seat("C")
+    busted.stack = 0
+    ctx = engine.start_hand(seed=3)
+    assert ctx.in_hand_mask == 0b011
+
+    actor = engine.next_actor()
+    events = engine.apply_action(actor, ActionType.FOLD, None)
+    assert any(ev["ev"] == "POT_AWARD" for ev in events)
+    assert engine.is_hand_complete()
+
+
+def test_first_to_act_skips_all_in_blinds():
+    engine = GameEngine(TableConfig(seats=4, starting_stack=1000, sb=10, bb=20))
+    for team in ("A", "B", "C", "D"):
+        engine.assign_seat(team)
+    engine.seats[1].stack = 10
+    engine.seats[2].stack = 15
+    ctx = engine.start_hand(seed=4)
+    assert ctx.button == 0
+    assert ctx.all_in_mask == 0b0110
+
+    # Both blinds are all in, but it is still four-handed: under the gun acts first.
+    assert engine.next_actor() == 3
+
+
+def test_all_in_for_less_is_not_prompted_again():
+    engine = GameEngine(TableConfig(seats=4, starting_stack=1000, sb=10, bb=20))
+    for team in ("A", "B", "C", "D"):
+        engine.assign_seat(team)
+    engine.seats[0].stack = 50
+    engine.start_hand(seed=11)
+
+    engine.apply_action(engine.next_actor(), ActionType.RAISE_TO, 100)  # seat 3
+    assert engine.next_actor() == 0
+    engine.apply_action(0, ActionType.CALL, None)  # all-in for less
+    engine.apply_action(engine.next_actor(), ActionType.RAISE_TO, 300)  # seat 1
+    engine.apply_action(engine.next_actor(), ActionType.RAISE_TO, 900)  # seat 2
+    engine.apply_action(engine.next_actor(), ActionType.CALL, None)  # seat 3
+    assert engine.next_actor() == 1
 
 
 def test_all_in_creates_side_pot_and_awards_correctly():
@@ -272,7 +369,7 @@ def test_all_in_creates_side_pot_and_awards_correctly():
             engine.apply_action(actor, ActionType.FOLD, None)
 
     assert engine.is_hand_complete()
-    assert not ctx.pending_callers
+    assert not ctx.pending_callers_mask
 
 
 def test_multiway_split_returns_equal_shares(monkeypatch):
@@ -281,14 +378,14 @@ def test_multiway_split_returns_equal_shares(monkeypatch):
         engine.assign_seat(name)
 
     # Build deck to force everyone to same straight
-    from core.cards import Card
+    from core.cards import Deck, card_int
 
     deck = [
-        Card("2", "h"), Card("2", "d"), Card("2", "c"),
-        Card("3", "h"), Card("3", "d"), Card("3", "c"),
-        Card("4", "s"), Card("5", "s"), Card("6", "s"), Card("7", "s"), Card("8", "s"),
+        card_int("2", "h"), card_int("2", "d"), card_int("2", "c"),
+        card_int("3", "h"), card_int("3", "d"), card_int("3", "c"),
+        card_int("4", "s"), card_int("5", "s"), card_int("6", "s"), card_int("7", "s"), card_int("8", "s"),
     ]
-    monkeypatch.setattr("core.game.build_deck", lambda seed=None: list(deck))
+    monkeypatch.setattr("core.game.build_deck", lambda seed=None: Deck(list(deck)))
 
     ctx = engine.start_hand()
     assert ctx is not None
@@ -393,6 +490,23 @@ def test_snapshot_includes_values_when_actor():
     assert snapshot["max_raise_to"] is not None
 
 
+def test_mutating_payloads_does_not_leak_into_engine():
+    engine, _ = setup_engine()
+    actor = engine.next_actor()
+    button = engine.hand.button
+    first = engine.act_payload(actor)
+    first["table"]["button"] = 99
+    first["players"].clear()
+    snapshot = engine.snapshot_payload(actor, time_ms_remaining=1000)
+    snapshot["players"][0]["stack"] = -1
+
+    again = engine.act_payload(actor)
+    assert again["table"]["button"] == button
+    assert len(again["players"]) == 4
+    assert all(row["stack"] >= 0 for row in again["players"])
+    assert engine.snapshot_payload(actor, time_ms_remaining=1000)["players"] == again["players"]
+
+
 def test_timer_fallback_prefers_check_then_call_then_fold():
     engine = GameEngine(TableConfig(seats=2, starting_stack=200, sb=10, bb=20, move_time_ms=1000))
     engine.assign_seat("A")
@@ -431,3 +545,19 @@ def test_spectator_state_includes_omniscient_view():
     assert state["next_actor"] in seats
     # Since spectator view is omniscient, each seat exposes committed stack data.
     assert all("committed" in entry for entry in seats.values())
+
+
+def test_hand_date_cache_expires_at_local_midnight_across_dst(monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is POSIX-only")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        # 2026-03-08 01:00 EST, an hour before clocks spring forward; that day is only 23 hours long.
+        monkeypatch.setattr(game_module.time, "time", lambda: 1772949600.0)
+        monkeypatch.setattr(game_module, "_date_cache", (0.0, ""))
+        assert game_module._hand_date() == "20260308"
+        assert game_module._date_cache[0] == 1773028800.0
+    finally:
+        monkeypatch.undo()
+        time.tzset()
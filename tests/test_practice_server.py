@@ -0,0 +1,48 @@
+import asyncio
+import json
+
+from core.models import TableConfig
+from practice.server import PracticeSession, RemoteBotClient
+
+
+class DummyWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def send(self, message: str) -> None:
+        self.sent.append(message)
+
+
+def broadcast(events: list, *, batch_events: bool) -> list:
+    ws = DummyWebSocket()
+    remote = RemoteBotClient(team_label="Alpha", websocket=ws, batch_events=batch_events)
+    session = PracticeSession(TableConfig(seats=2, starting_stack=1000, sb=10, bb=20), [remote])
+
+    async def run() -> None:
+        await session._broadcast_events(events)
+        await remote.flush()
+
+    asyncio.run(run())
+    return [json.loads(frame) for frame in ws.sent]
+
+
+def make_events() -> list:
+    return [
+        {"ev": "POST_BLIND", "seat": 0, "amount": 10},
+        {"ev": "POST_BLIND", "seat": 1, "amount": 20},
+    ]
+
+
+def test_batched_event_items_match_plain_event_frames():
+    (batched,) = broadcast(make_events(), batch_events=True)
+    assert batched["type"] == "events" and batched["v"] == 1
+
+    plain = broadcast(make_events(), batch_events=False)
+    assert batched["items"] == plain
+    for item in batched["items"]:
+        assert item["type"] == "event" and item["v"] == 1
+
+
+def test_single_event_is_sent_as_plain_frame():
+    frames = broadcast(make_events()[:1], batch_events=True)
+    assert frames == [{"v": 1, "type": "event", "ev": "POST_BLIND", "seat": 0, "amount": 10}]
@@ -0,0 +1,78 @@
+import asyncio
+import importlib
+import json
+import sys
+
+import pytest
+
+
+# Fake socket that replays host frames and records whatever the bot sends back.
+class ScriptedWebSocket:
+    def __init__(self, frames: list, subprotocol: str | None = None) -> None:
+        self.frames = frames
+        self.subprotocol = subprotocol
+        self.sent: list = []
+
+    async def send(self, message) -> None:
+        self.sent.append(message)
+
+    def __aiter__(self):
+        return self._replay()
+
+    async def _replay(self):
+        for frame in self.frames:
+            yield frame
+
+
+ACT = {
+    "type": "act",
+    "v": 1,
+    "hand_id": "H-1",
+    "seat": 0,
+    "phase": "PRE_FLOP",
+    "you": {"hole": ["Ah", "Kd"], "stack": 980, "committed": 20, "to_call": 0},
+    "table": {"button": 0, "sb": 10, "bb": 20, "seats": 2},
+    "legal": ["CHECK", "RAISE_TO"],
+    "min_raise_to": 40,
+    "max_raise_to": 1000,
+}
+
+
+def load_sample_bot(monkeypatch: pytest.MonkeyPatch, *, with_orjson: bool):
+    if with_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.delitem(sys.modules, "sample_bot", raising=False)
+    return importlib.import_module("sample_bot")
+
+
+def send_one_action(bot) -> object:
+    frames = [json.dumps(ACT), json.dumps({"type": "match_end", "v": 1})]
+    ws = ScriptedWebSocket(frames)
+    asyncio.run(bot.play_hand(ws, "Tester"))
+    assert len(ws.sent) == 1
+    return ws.sent[0]
+
+
+def test_action_is_binary_json_with_orjson(monkeypatch: pytest.MonkeyPatch):
+    bot = load_sample_bot(monkeypatch, with_orjson=True)
+    frame = send_one_action(bot)
+    assert isinstance(frame, bytes)
+    assert json.loads(frame)["hand_id"] == "H-1"
+
+
+def test_action_is_text_json_without_orjson(monkeypatch: pytest.MonkeyPatch):
+    bot = load_sample_bot(monkeypatch, with_orjson=False)
+    frame = send_one_action(bot)
+    assert isinstance(frame, str)
+    payload = json.loads(frame)
+    assert payload["type"] == "action" and payload["v"] == 1 and payload["hand_id"] == "H-1"
+
+
+def test_binary_json_frames_decode_as_json(monkeypatch: pytest.MonkeyPatch):
+    bot = load_sample_bot(monkeypatch, with_orjson=True)
+    frames = [json.dumps(ACT).encode(), json.dumps({"type": "match_end", "v": 1}).encode()]
+    ws = ScriptedWebSocket(frames)
+    asyncio.run(bot.play_hand(ws, "Tester"))
+    assert [json.loads(frame)["hand_id"] for frame in ws.sent] == ["H-1"]
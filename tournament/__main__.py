@@ -1,8 +1,8 @@
 import argparse
-import asyncio
 import logging
 
 from core.models import TableConfig
+from core.runtime import run_event_loop
 from .server import HostServer
 
 logging.basicConfig(level=logging.INFO)
@@ -47,7 +47,7 @@ def main() -> None:
     )
 
     server = HostServer(config, hand_control=args.hand_control)
-    asyncio.run(server.start(host=args.host, port=args.port))
+    run_event_loop(server.start(host=args.host, port=args.port))
 
 
 if __name__ == "__main__":
@@ -11,8 +11,10 @@ from typing import Dict, List, Optional, Set
 import websockets
 from websockets.server import WebSocketServerProtocol
 
+from core.cards import cards_to_labels
 from core.game import GameEngine
 from core.models import ActionType, TableConfig
+from core.runtime import json_encode
 
 LOGGER = logging.getLogger("poker_host")
 
@@ -655,13 +657,13 @@ class HostServer:
                     "team": seat.team if seat else f"Seat {idx}",
                     "stack": entry["stack"],
                     "committed": seat.committed if seat else 0,
-                    "hole": list(seat.hole_cards) if seat else [],
+                    "hole": cards_to_labels(seat.hole_cards) if seat else [],
                     "has_folded": seat.has_folded if seat else False,
                     "connected": seat.connected if seat else False,
                     "is_button": ctx.button == idx if ctx else False,
                 }
             )
-        community = [card.label for card in ctx.community] if ctx else []
+        community = list(ctx.community_labels) if ctx else []
         return {
             "hand_id": end_payload["hand_id"],
             "table_id": self.table_id,
@@ -690,7 +692,7 @@ class HostServer:
     def _envelope(self, msg_type: str, payload: Dict[str, object]) -> str:
         body = {"type": msg_type, "v": 1, "ts": datetime.now(timezone.utc).isoformat()}
         body.update(payload)
-        return json.dumps(body)
+        return json_encode(body)
 
     async def _read_message(self, websocket: WebSocketServerProtocol) -> Optional[Dict[str, object]]:
         try:
@@ -699,7 +701,8 @@ class HostServer:
         except Exception:
             return None
 
-    def _decode(self, raw: str) -> Dict[str, object]:
+    def _decode(self, raw: str | bytes) -> Dict[str, object]:
+        # Clients may send their JSON as text or as UTF-8 binary frames; json.loads takes both.
         try:
             return json.loads(raw)
         except json.JSONDecodeError: